@@ -17,7 +17,13 @@ logger = logging.getLogger(__name__)
 
 
 @click.command()
-@click.argument("prompt", nargs=-1, required=True)
+@click.argument("prompt", nargs=-1)
+@click.option(
+    "--file",
+    "prompt_file",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    help="Read the prompt from a file instead of the command line",
+)
 @click.option(
     "--max-skills",
     default=3,
@@ -47,6 +53,7 @@ logger = logging.getLogger(__name__)
 )
 def enrich(
     prompt: tuple[str, ...],
+    prompt_file: Path | None,
     max_skills: int,
     detailed: bool,
     threshold: float,
@@ -83,9 +90,21 @@ def enrich(
 
         # Quoted prompts for complex sentences
         mcp-skillset enrich "Create a FastAPI endpoint that validates user input and returns JSON"
+
+        # Read a longer prompt from a file
+        mcp-skillset enrich --file prompt.txt
     """
-    # Join prompt tuple into single string
-    prompt_text = " ".join(prompt)
+    if prompt and prompt_file:
+        raise click.UsageError("Pass either PROMPT or --file, not both.")
+
+    if prompt_file:
+        prompt_text = prompt_file.read_text(encoding="utf-8").strip()
+    else:
+        # Join prompt tuple into single string
+        prompt_text = " ".join(prompt)
+
+    if not prompt_text:
+        raise click.UsageError("Provide a PROMPT or --file with prompt text.")
 
     console.print("🔍 [bold]Enriching prompt...[/bold]\n")
     console.print(f"[dim]Prompt: {prompt_text}[/dim]\n")
@@ -6,10 +6,14 @@ from pathlib import Path
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class Repository:
     """Repository metadata.
 
+    Slotted to keep per-instance memory small when the metadata store
+    materializes large catalogs; not frozen because callers update fields
+    in place before persisting.
+
     Attributes:
         id: Unique repository identifier
         url: Git repository URL
@@ -239,7 +239,7 @@ class IndexingEngine:
         Reindexing Process:
         1. Clear existing indices (if force=True)
         2. Discover all skills via SkillManager
-        3. Generate embeddings for all skills
+        3. Generate and store embeddings for all skills in one batch
         4. Build knowledge graph relationships
         5. Return statistics
 
@@ -277,13 +277,21 @@ class IndexingEngine:
         skills = self.skill_manager.discover_skills()
         logger.info(f"Discovered {len(skills)} skills for indexing")
 
-        # 3. Index each skill (embeddings + graph)
+        # 3. Embed and store all skills in one batch
+        try:
+            added = self.vector_store.index_skills(skills)
+            logger.info(f"Added {added} new skills to vector store")
+        except Exception as e:
+            logger.error(f"Failed to index skills in vector store: {e}")
+
+        # 4. Add each skill and its relationships to the knowledge graph
         indexed_count = 0
         failed_count = 0
 
         for skill in skills:
             try:
-                self.index_skill(skill)
+                self.graph_store.add_skill(skill)
+                self.graph_store.add_relationships(skill)
                 indexed_count += 1
             except Exception as e:
                 logger.error(f"Failed to index skill {skill.id}: {e}")
@@ -296,7 +304,7 @@ class IndexingEngine:
             f"Reindexing complete: {indexed_count} indexed, {failed_count} failed"
         )
 
-        # 4. Return statistics
+        # 5. Return statistics
         return self.get_stats()
 
     def search(
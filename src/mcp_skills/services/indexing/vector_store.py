@@ -14,22 +14,204 @@ Error Handling:
 - ChromaDB connection failures → Raise RuntimeError with details
 - Corrupted database → Delete and reinitialize (future enhancement)
 - Empty embeddings → Log warning and skip skill
+
+Import Cost:
+chromadb and sentence-transformers (with torch) take several seconds to
+import, so they are loaded on first VectorStore construction rather than
+when this module is imported. CLI commands that never open the index do
+not pay for them.
 """
 
+import copy
+import functools
+import hashlib
+import importlib
 import logging
+import os
+import sqlite3
+import threading
+from collections import OrderedDict, deque
+from collections.abc import Iterable
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, Literal
 
-import chromadb
-from chromadb.config import Settings
-from chromadb.utils import embedding_functions
-from sentence_transformers import SentenceTransformer
+import numpy as np
 
 from mcp_skills.models.skill import Skill
 
 
+if TYPE_CHECKING:
+    import chromadb
+    from chromadb.config import Settings
+    from chromadb.utils import embedding_functions
+    from sentence_transformers import SentenceTransformer
+
+
 logger = logging.getLogger(__name__)
 
+# Module attribute -> (module to import, attribute of it or None)
+_LAZY_IMPORTS: dict[str, tuple[str, str | None]] = {
+    "chromadb": ("chromadb", None),
+    "Settings": ("chromadb.config", "Settings"),
+    "embedding_functions": ("chromadb.utils.embedding_functions", None),
+    "SentenceTransformer": ("sentence_transformers", "SentenceTransformer"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a heavy backend on first attribute access (PEP 562).
+
+    The value is stored in the module globals, so later lookups (and
+    unittest.mock patches of e.g. ``vector_store.chromadb``) see it.
+    """
+    try:
+        module_name, attribute = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = importlib.import_module(module_name)
+    if attribute is not None:
+        value = getattr(value, attribute)
+    globals()[name] = value
+    return value
+
+
+def _import_backends() -> None:
+    """Bind every lazily imported backend not yet in the module globals."""
+    for name in _LAZY_IMPORTS:
+        if name not in globals():
+            __getattr__(name)
+
+
+_CACHE_DTYPES = {"fp32": np.float32, "fp16": np.float16}
+
+# sentence-transformers inference backends; onnx/openvino need the
+# matching sentence-transformers extra (optimum) installed
+_EMBEDDING_BACKENDS = ("torch", "onnx", "openvino")
+
+EMBEDDING_MODEL_NAME = "sentence-transformers/all-MiniLM-L6-v2"
+
+# A rowid table: INSERT OR REPLACE gives a rewritten row a new, highest
+# rowid, so rowid order is write order and pruning drops the oldest rows
+_SQL_CREATE_EMBEDDINGS = """
+    CREATE TABLE IF NOT EXISTS embeddings (
+        key BLOB PRIMARY KEY,
+        vec BLOB NOT NULL
+    )
+"""
+
+_SQL_PUT_EMBEDDING = "INSERT OR REPLACE INTO embeddings (key, vec) VALUES (?, ?)"
+
+_SQL_PRUNE_EMBEDDINGS = """
+    DELETE FROM embeddings WHERE rowid <= (
+        SELECT rowid FROM embeddings ORDER BY rowid DESC LIMIT 1 OFFSET ?
+    )
+"""
+
+# Bumped whenever the stored vector format changes; older tables are dropped
+_EMBEDDINGS_SCHEMA_VERSION = 2
+
+# Stay below SQLite's default SQLITE_MAX_VARIABLE_NUMBER (999 before 3.32)
+_MAX_SQL_VARIABLES = 900
+
+
+@functools.lru_cache(maxsize=4)
+def _get_embedding_model(
+    model_name: str, backend: str = "torch"
+) -> "SentenceTransformer":
+    """Load a sentence-transformers model once per process and backend.
+
+    Every VectorStore shares the loaded weights, so constructing another
+    store does not deserialize the model again. Load failures propagate
+    and are not cached.
+    """
+    if backend == "torch":
+        # Default path; also works on sentence-transformers < 3.2
+        return SentenceTransformer(model_name)
+    return SentenceTransformer(model_name, backend=backend)
+
+
+def _text_key(text: str, backend: str) -> bytes:
+    """Digest identifying an embedding of ``text`` by the model on ``backend``.
+
+    Backends run different kernels (and ONNX/OpenVINO may be quantized), so
+    their vectors differ slightly and must not be served for each other.
+    """
+    return hashlib.blake2b(
+        f"{EMBEDDING_MODEL_NAME}|{backend}|{text}".encode(), digest_size=16
+    ).digest()
+
+
+def _default_cache_dir() -> Path:
+    """Per-user cache directory, honoring XDG_CACHE_HOME."""
+    cache_home = os.environ.get("XDG_CACHE_HOME")
+    base = Path(cache_home) if cache_home else Path.home() / ".cache"
+    return base / "mcp-skillset"
+
+
+class _DiskEmbeddingCache:
+    """Embeddings persisted in one SQLite file, keyed by text digest.
+
+    Vectors are stored as float32 bytes (1.5KB for 384 dimensions), exactly
+    as encoded, so a skill indexed from the cache gets the same vector as
+    one indexed on a cold cache. Lookup or write failures are logged and
+    treated as cache misses, so a broken cache file never stops embedding
+    generation.
+
+    The file is pruned to the max_rows most recently written vectors each
+    time it is opened, so it cannot grow without bound across runs.
+    """
+
+    def __init__(self, db_path: Path, max_rows: int) -> None:
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute("PRAGMA synchronous = NORMAL")
+        with self._conn:
+            (version,) = self._conn.execute("PRAGMA user_version").fetchone()
+            if version != _EMBEDDINGS_SCHEMA_VERSION:
+                self._conn.execute("DROP TABLE IF EXISTS embeddings")
+                self._conn.execute(
+                    f"PRAGMA user_version = {_EMBEDDINGS_SCHEMA_VERSION}"
+                )
+            self._conn.execute(_SQL_CREATE_EMBEDDINGS)
+            self._conn.execute(_SQL_PRUNE_EMBEDDINGS, (max_rows,))
+
+    def get_many(self, keys: list[bytes]) -> dict[bytes, np.ndarray]:
+        """Fetch stored float32 vectors for whichever keys are present."""
+        found: dict[bytes, np.ndarray] = {}
+        try:
+            with self._lock:
+                for start in range(0, len(keys), _MAX_SQL_VARIABLES):
+                    chunk = keys[start : start + _MAX_SQL_VARIABLES]
+                    placeholders = ", ".join("?" * len(chunk))
+                    rows = self._conn.execute(
+                        f"SELECT key, vec FROM embeddings WHERE key IN ({placeholders})",
+                        chunk,
+                    )
+                    for key, vec in rows:
+                        found[key] = np.frombuffer(vec, dtype=np.float32)
+        except sqlite3.Error as e:
+            logger.debug(f"Embedding cache lookup failed: {e}")
+        return found
+
+    def put_many(self, items: Iterable[tuple[bytes, np.ndarray]]) -> None:
+        """Store vectors (as float32) in one transaction."""
+        try:
+            with self._lock, self._conn:
+                self._conn.executemany(
+                    _SQL_PUT_EMBEDDING,
+                    ((key, vec.astype(np.float32).tobytes()) for key, vec in items),
+                )
+        except sqlite3.Error as e:
+            logger.debug(f"Embedding cache write failed: {e}")
+
+    def close(self) -> None:
+        """Close the cache database."""
+        with self._lock:
+            self._conn.close()
+
 
 class VectorStore:
     """Vector store using ChromaDB for semantic similarity search.
@@ -49,18 +231,83 @@ class VectorStore:
     - Embedding generation: ~15ms per skill on CPU, ~3ms on GPU
     - Search: O(n log k) with ChromaDB indexing
     - Storage: ~2KB per skill (embeddings + metadata)
+    - Embeddings of recently seen texts are served from an in-memory LRU;
+      skill (not query) embeddings are also kept in a bounded SQLite cache
+      shared across runs
     """
 
-    def __init__(self, persist_directory: Path | None = None) -> None:
+    EMBEDDING_CACHE_SIZE = 10_000
+
+    # Rows kept in the persistent embedding cache (~1.5KB each)
+    DISK_CACHE_SIZE = 20_000
+
+    # Recent search answers, reused for queries at least this similar
+    QUERY_CACHE_SIZE = 128
+    QUERY_CACHE_THRESHOLD = 0.97
+
+    # Collections up to this size are mirrored in memory and searched with
+    # numpy instead of ChromaDB's HNSW index
+    MEM_SEARCH_THRESHOLD = 1000
+
+    def __init__(
+        self,
+        persist_directory: Path | None = None,
+        cache_precision: Literal["fp32", "fp16"] = "fp32",
+        cache_dir: Path | None = None,
+        hnsw_m: int = 16,
+        hnsw_construction_ef: int = 100,
+        hnsw_search_ef: int = 100,
+        embedding_backend: Literal["torch", "onnx", "openvino"] = "torch",
+    ) -> None:
         """Initialize ChromaDB vector store.
 
         Args:
             persist_directory: Path to store ChromaDB data
                              (defaults to ~/.mcp-skillset/chromadb/)
+            cache_precision: Storage precision of the in-memory embedding
+                             cache; "fp16" halves its footprint at a
+                             negligible cosine error for MiniLM
+            cache_dir: Directory for the persistent embedding cache
+                       (defaults to $XDG_CACHE_HOME/mcp-skillset/)
+            hnsw_m: HNSW graph degree for a newly created collection
+            hnsw_construction_ef: HNSW candidate list size while inserting
+            hnsw_search_ef: HNSW candidate list size while querying
+            embedding_backend: sentence-transformers inference backend;
+                               "onnx" (onnxruntime) or "openvino" run the
+                               exported model with fused CPU kernels and
+                               need the mcp-skillset[onnx] / [openvino]
+                               extra
 
         Raises:
+            ValueError: If cache_precision or embedding_backend is unknown
             RuntimeError: If ChromaDB initialization fails
         """
+        if cache_precision not in _CACHE_DTYPES:
+            raise ValueError(
+                f"cache_precision must be one of {sorted(_CACHE_DTYPES)}, "
+                f"got {cache_precision!r}"
+            )
+        if embedding_backend not in _EMBEDDING_BACKENDS:
+            raise ValueError(
+                f"embedding_backend must be one of {list(_EMBEDDING_BACKENDS)}, "
+                f"got {embedding_backend!r}"
+            )
+        self._cache_dtype = _CACHE_DTYPES[cache_precision]
+        self._embedding_backend = embedding_backend
+
+        _import_backends()
+
+        # Defaults match ChromaDB's own. Collections up to
+        # MEM_SEARCH_THRESHOLD are searched in memory, so HNSW only serves
+        # the large ones, where a sparser graph costs the most recall.
+        # ChromaDB only applies these when it creates the collection;
+        # existing ones keep theirs.
+        self._hnsw_metadata = {
+            "hnsw:M": hnsw_m,
+            "hnsw:construction_ef": hnsw_construction_ef,
+            "hnsw:search_ef": hnsw_search_ef,
+        }
+
         self.persist_directory = persist_directory or (
             Path.home() / ".mcp-skillset" / "chromadb"
         )
@@ -68,6 +315,32 @@ class VectorStore:
         # Ensure storage directory exists
         self.persist_directory.mkdir(parents=True, exist_ok=True)
 
+        # Embeddings (in cache_precision) keyed by a text digest, oldest first
+        self._embedding_cache: OrderedDict[bytes, np.ndarray] = OrderedDict()
+        self._cache_hits = 0
+        self._disk_hits = 0
+        self._cache_misses = 0
+
+        # Persistent tier behind the LRU; embedding works without it
+        self._disk_cache: _DiskEmbeddingCache | None
+        try:
+            self._disk_cache = _DiskEmbeddingCache(
+                (cache_dir or _default_cache_dir()) / "embeddings.db",
+                max_rows=self.DISK_CACHE_SIZE,
+            )
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Persistent embedding cache disabled: {e}")
+            self._disk_cache = None
+
+        # (query embedding, (backend, top_k, filters), results), newest last
+        self._query_cache: deque[
+            tuple[
+                np.ndarray,
+                tuple[str, int, dict[str, Any] | None],
+                list[dict[str, Any]],
+            ]
+        ] = deque(maxlen=self.QUERY_CACHE_SIZE)
+
         # Initialize ChromaDB client
         try:
             self._init_chromadb()
@@ -101,7 +374,7 @@ class VectorStore:
             # Use sentence-transformers embedding function
             # This matches our manual embedding model for consistency
             embedding_fn = embedding_functions.SentenceTransformerEmbeddingFunction(
-                model_name="sentence-transformers/all-MiniLM-L6-v2"
+                model_name=EMBEDDING_MODEL_NAME
             )
 
             # Get or create collection
@@ -109,18 +382,174 @@ class VectorStore:
             self.collection = self.chroma_client.get_or_create_collection(
                 name="skills",
                 embedding_function=embedding_fn,
-                metadata={"description": "MCP Skills vector embeddings"},
+                metadata={
+                    "description": "MCP Skills vector embeddings",
+                    **self._hnsw_metadata,
+                },
             )
 
+            # Cached collection size; None means "ask ChromaDB"
+            self._count: int | None = None
+            # Database state the cached values were read from
+            self._signature = self._collection_signature()
+
             logger.info(
                 f"ChromaDB initialized at {self.persist_directory} "
-                f"with {self.collection.count()} skills"
+                f"with {self.count()} skills"
             )
 
+            self._load_memory_index()
+
         except Exception as e:
             logger.error(f"ChromaDB initialization failed: {e}")
             raise
 
+    def _collection_signature(self) -> tuple[int, int] | None:
+        """Cheap fingerprint of the collection's on-disk state.
+
+        Every ChromaDB write, from this or any other process (e.g. a CLI
+        reindex while the MCP server runs), rewrites chroma.sqlite3, so its
+        mtime and size change. None if the file cannot be read.
+        """
+        try:
+            stat = (self.persist_directory / "chroma.sqlite3").stat()
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _sync_with_collection(self) -> None:
+        """Reload cached collection state if the database changed on disk.
+
+        The cached count and search answers are dropped and the in-memory
+        mirror is rebuilt from ChromaDB.
+
+        When nothing changed this costs one stat() call, so it runs before
+        every count, search and add.
+        """
+        signature = self._collection_signature()
+        if signature == self._signature:
+            return
+        self._signature = signature
+        self._count = None
+        self.clear_query_cache()
+        self._load_memory_index()
+
+    def _load_memory_index(self) -> None:
+        """Mirror a small collection's embeddings and metadata in memory.
+
+        Design Decision: Brute-Force Search for Small Collections
+
+        Rationale: For a few hundred vectors, one (n, 384) matrix product
+        is faster than a ChromaDB query, which walks the HNSW graph and
+        then reads metadata back from SQLite. The mirror is loaded here,
+        extended by index_skills and reset by clear(). It is reloaded when
+        another process changes the collection on disk, and dropped while
+        the collection is larger than MEM_SEARCH_THRESHOLD.
+        """
+        self._reset_memory_index(enabled=False)
+        try:
+            if self.count() > self.MEM_SEARCH_THRESHOLD:
+                return
+            existing = self.collection.get(include=["embeddings", "metadatas"])
+        except Exception as e:
+            logger.debug(f"In-memory search index disabled: {e}")
+            return
+
+        self._reset_memory_index(enabled=True)
+        if existing["ids"]:
+            self._mirror_add(
+                existing["ids"],
+                np.asarray(existing["embeddings"], dtype=np.float32),
+                [dict(metadata or {}) for metadata in existing["metadatas"] or []],
+            )
+
+    def _reset_memory_index(self, enabled: bool) -> None:
+        """Empty the in-memory mirror, keeping it in use only if enabled."""
+        self._mem_ids: list[str] | None = [] if enabled else None
+        self._mem_embs: np.ndarray | None = None
+        self._mem_meta: list[dict[str, Any]] = []
+        self._mem_id_set: set[str] = set()
+
+    def _mirror_add(
+        self, ids: list[str], embeddings: np.ndarray, metadatas: list[dict[str, Any]]
+    ) -> None:
+        """Extend the in-memory mirror after a successful collection add.
+
+        ChromaDB keeps the first copy of an ID that is added twice, so the
+        mirror does too.
+        """
+        if self._mem_ids is None:
+            return
+
+        new_rows = []
+        for row, skill_id in enumerate(ids):
+            if skill_id not in self._mem_id_set:
+                self._mem_id_set.add(skill_id)
+                new_rows.append(row)
+        if not new_rows:
+            return
+
+        if len(self._mem_ids) + len(new_rows) > self.MEM_SEARCH_THRESHOLD:
+            # Too large to scan; ChromaDB takes over from here on
+            self._reset_memory_index(enabled=False)
+            return
+
+        rows = embeddings[new_rows]
+        self._mem_ids.extend(ids[row] for row in new_rows)
+        self._mem_meta.extend(metadatas[row] for row in new_rows)
+        self._mem_embs = (
+            rows if self._mem_embs is None else np.vstack([self._mem_embs, rows])
+        )
+
+    def _memory_search(
+        self, query_embedding: np.ndarray, top_k: int, filters: dict[str, Any] | None
+    ) -> list[dict[str, Any]] | None:
+        """Answer a search from the in-memory mirror.
+
+        Returns:
+            Results in search() format, or None when the mirror is not in
+            use or the filter needs ChromaDB's full where-clause support
+            (only a single equality condition is evaluated here)
+        """
+        if self._mem_ids is None or len(self._mem_ids) >= self.MEM_SEARCH_THRESHOLD:
+            return None
+        if filters and (
+            len(filters) != 1
+            or any(
+                key.startswith("$") or isinstance(value, dict | list)
+                for key, value in filters.items()
+            )
+        ):
+            return None
+        if self._mem_embs is None or top_k <= 0:
+            return []
+
+        candidates = np.arange(len(self._mem_ids))
+        if filters:
+            [(key, value)] = filters.items()
+            candidates = candidates[
+                [metadata.get(key) == value for metadata in self._mem_meta]
+            ]
+            if not candidates.size:
+                return []
+
+        # Squared L2 distance, the metric of ChromaDB's default "l2" space
+        diff = self._mem_embs[candidates] - query_embedding
+        distances = np.einsum("ij,ij->i", diff, diff)
+
+        k = min(top_k, candidates.size)
+        nearest = np.argpartition(distances, k - 1)[:k]
+        nearest = nearest[np.argsort(distances[nearest], kind="stable")]
+
+        return [
+            {
+                "skill_id": self._mem_ids[candidates[i]],
+                "score": 1.0 / (1.0 + float(distances[i])),
+                "metadata": dict(self._mem_meta[candidates[i]]),
+            }
+            for i in nearest
+        ]
+
     def _init_embedding_model(self) -> None:
         """Initialize sentence-transformers embedding model.
 
@@ -130,13 +559,16 @@ class VectorStore:
         - Quality: Optimized for semantic similarity
 
         Performance Note:
-        - Model loaded once and cached in memory (~90MB)
+        - Model loaded once per process and shared across stores (~90MB)
         - GPU acceleration used if available (CUDA)
         """
-        self.embedding_model = SentenceTransformer(
-            "sentence-transformers/all-MiniLM-L6-v2"
+        self.embedding_model = _get_embedding_model(
+            EMBEDDING_MODEL_NAME, self._embedding_backend
+        )
+        logger.info(
+            f"Sentence-transformers model loaded successfully "
+            f"({self._embedding_backend} backend)"
         )
-        logger.info("Sentence-transformers model loaded successfully")
 
     def index_skill(self, skill: Skill) -> None:
         """Add skill to vector store.
@@ -152,35 +584,207 @@ class VectorStore:
         - Embedding generation failure → Log error and skip
         - ChromaDB add failure → Log error (allows batch to continue)
         """
-        try:
-            # Create embeddable text
+        self.index_skills([skill])
+
+    def index_skills(self, skills: list[Skill], batch_size: int = 64) -> int:
+        """Add several skills to vector store in one batch.
+
+        Encodes all embeddable texts with a single model call and stores
+        them with as few ChromaDB adds as its max batch size allows,
+        instead of one round trip per skill.
+
+        Args:
+            skills: Skill objects to index
+            batch_size: Encoder mini-batch size
+
+        Returns:
+            Number of skills added to the store; skills whose ID is already
+            stored (or repeated within the batch) are skipped and not counted
+
+        Error Handling:
+        - Empty embeddable text → Log warning and skip that skill
+        - Embedding generation failure → Log error, add nothing
+        - ChromaDB add failure → Log error, skip that chunk and continue
+        """
+        self._sync_with_collection()
+
+        kept: list[Skill] = []
+        documents: list[str] = []
+        seen: set[str] = set()
+
+        for skill in skills:
+            # ChromaDB rejects an add that repeats an ID; keep the first
+            if skill.id in seen:
+                logger.debug(f"Skipping duplicate skill in batch: {skill.id}")
+                continue
+            seen.add(skill.id)
+
             embeddable_text = self._create_embeddable_text(skill)
 
             if not embeddable_text.strip():
                 logger.warning(f"Empty embeddable text for skill: {skill.id}")
-                return
+                continue
 
-            # Prepare metadata
-            metadata = {
+            kept.append(skill)
+            documents.append(embeddable_text)
+
+        if not kept:
+            return 0
+
+        try:
+            embeddings = self._cached_embeddings(documents, batch_size=batch_size)
+        except Exception as e:
+            logger.error(f"Failed to embed {len(kept)} skills for vector store: {e}")
+            # Don't raise - allow indexing to continue for other skills
+            return 0
+
+        # Build ChromaDB metadata only once the batch is known to be stored
+        ids = [skill.id for skill in kept]
+        metadatas: list[dict[str, Any]] = [
+            {
                 "skill_id": skill.id,
                 "name": skill.name,
                 "category": skill.category,
                 "tags": ",".join(skill.tags),  # Comma-separated for ChromaDB
                 "repo_id": skill.repo_id,
             }
+            for skill in kept
+        ]
+
+        # ChromaDB rejects adds larger than its max batch size
+        max_batch = self.chroma_client.get_max_batch_size()
+        added = 0
+
+        for start in range(0, len(ids), max_batch):
+            end = start + max_batch
+            try:
+                # ChromaDB silently keeps its copy of an ID it already has,
+                # so only send the new ones and count exactly what was added
+                stored = set(self.collection.get(ids=ids[start:end], include=[])["ids"])
+                rows = [
+                    row
+                    for row in range(start, min(end, len(ids)))
+                    if ids[row] not in stored
+                ]
+                if not rows:
+                    continue
+                chunk_ids = [ids[row] for row in rows]
+                chunk_metadatas = [metadatas[row] for row in rows]
+                self.collection.add(
+                    ids=chunk_ids,
+                    embeddings=embeddings[rows].tolist(),
+                    documents=[documents[row] for row in rows],
+                    metadatas=chunk_metadatas,
+                )
+            except Exception as e:
+                logger.error(
+                    f"Failed to index {len(ids[start:end])} skills in vector store: {e}"
+                )
+                # Don't raise - allow indexing to continue for other skills
+                continue
+            added += len(rows)
+            self._mirror_add(chunk_ids, embeddings[rows], chunk_metadatas)
+
+        if added:
+            logger.debug(f"Indexed {added} skills in vector store")
+            self.clear_query_cache()
+            if self._count is not None:
+                self._count += added
+            # Our own write; the cached state already reflects it
+            self._signature = self._collection_signature()
+        return added
+
+    def _encode_batch(self, texts: list[str], batch_size: int = 32) -> np.ndarray:
+        """Encode texts into one embedding matrix, rows in input order.
+
+        SentenceTransformer.encode already sorts a list input by length
+        before cutting mini-batches (and restores the input order), so
+        each batch is padded only to its own longest text. Passing whole
+        lists here, rather than one text per call, is what lets that
+        smart batching apply.
 
-            # Add to ChromaDB (embeddings generated automatically)
-            self.collection.add(
-                ids=[skill.id],
-                documents=[embeddable_text],
-                metadatas=[metadata],
-            )
+        Args:
+            texts: Non-empty texts to encode
+            batch_size: Encoder mini-batch size
+
+        Returns:
+            L2-normalized float32 array of shape (len(texts), 384)
+        """
+        embeddings: np.ndarray = self.embedding_model.encode(
+            texts,
+            batch_size=batch_size,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+            show_progress_bar=False,
+        )
+        return embeddings.astype(np.float32, copy=False)
 
-            logger.debug(f"Indexed skill in vector store: {skill.id}")
+    def _cached_embeddings(
+        self, texts: list[str], batch_size: int = 32, persist: bool = True
+    ) -> np.ndarray:
+        """Return embeddings for texts, encoding only those not cached.
 
-        except Exception as e:
-            logger.error(f"Failed to index skill {skill.id} in vector store: {e}")
-            # Don't raise - allow indexing to continue for other skills
+        Args:
+            texts: Non-empty texts to embed
+            batch_size: Encoder mini-batch size for the cache misses
+            persist: Also read and write the persistent cache; False keeps
+                     the texts (e.g. user queries) in memory only
+
+        Returns:
+            float32 array with one row per text, in input order
+        """
+        keys = [_text_key(text, self._embedding_backend) for text in texts]
+        cache = self._embedding_cache
+        missing: dict[bytes, str] = {}
+        for key, text in zip(keys, texts, strict=True):
+            if key in cache:
+                cache.move_to_end(key)
+                self._cache_hits += 1
+            elif key not in missing:
+                missing[key] = text
+
+        found = {key: cache[key] for key in keys if key in cache}
+
+        disk_cache = self._disk_cache if persist else None
+
+        if missing and disk_cache is not None:
+            for key, stored in disk_cache.get_many(list(missing)).items():
+                embedding = stored.astype(self._cache_dtype)
+                embedding.flags.writeable = False
+                found[key] = cache[key] = embedding
+                del missing[key]
+                self._disk_hits += 1
+
+        if missing:
+            self._cache_misses += len(missing)
+            encoded = self._encode_batch(list(missing.values()), batch_size)
+            # Persist full precision; only the in-memory tier is rounded
+            if disk_cache is not None:
+                disk_cache.put_many(zip(missing, encoded, strict=True))
+            encoded = encoded.astype(self._cache_dtype, copy=False)
+            # Cached rows are shared, so keep them read-only
+            encoded.flags.writeable = False
+            found.update(zip(missing, encoded, strict=True))
+            cache.update(zip(missing, encoded, strict=True))
+
+        while len(cache) > self.EMBEDDING_CACHE_SIZE:
+            cache.popitem(last=False)
+
+        return np.stack([found[key] for key in keys]).astype(np.float32, copy=False)
+
+    def get_stats(self) -> dict[str, int]:
+        """Get embedding cache statistics.
+
+        Returns:
+            Dict with cache size, in-memory hits, persistent-cache hits
+            and misses
+        """
+        return {
+            "embedding_cache_size": len(self._embedding_cache),
+            "embedding_cache_hits": self._cache_hits,
+            "embedding_disk_hits": self._disk_hits,
+            "embedding_cache_misses": self._cache_misses,
+        }
 
     def _create_embeddable_text(self, skill: Skill) -> str:
         """Create text representation for embedding.
@@ -225,7 +829,7 @@ class VectorStore:
         Performance:
         - Time Complexity: O(n) where n = text length
         - ~15ms per skill on CPU, ~3ms on GPU
-        - Embeddings cached by ChromaDB (no regeneration needed)
+        - Repeated texts served from the in-memory embedding cache
 
         Error Handling:
         - Empty text: Returns empty list
@@ -239,13 +843,10 @@ class VectorStore:
                 logger.warning(f"Empty embeddable text for skill: {skill.id}")
                 return []
 
-            # Generate embedding using sentence-transformers
-            embedding = self.embedding_model.encode(
-                embeddable_text, convert_to_numpy=True
-            )
-
-            # Convert numpy array to list for JSON serialization
-            embedding_list: list[float] = embedding.tolist()
+            # Generate embedding using sentence-transformers (or the cache)
+            embedding_list: list[float] = self._cached_embeddings([embeddable_text])[
+                0
+            ].tolist()
             return embedding_list
 
         except Exception as e:
@@ -286,10 +887,34 @@ class VectorStore:
             0.92
         """
         try:
+            self._sync_with_collection()
+
+            # Queries are user input; never write them to disk
+            query_embedding = self._cached_embeddings([query], persist=False)[0]
+            cache_key = (self._embedding_backend, top_k, filters or None)
+
+            # Embeddings are L2-normalized, so the dot product is the cosine
+            for cached_embedding, cached_key, cached_results in reversed(
+                self._query_cache
+            ):
+                if (
+                    cached_key == cache_key
+                    and float(np.dot(cached_embedding, query_embedding))
+                    >= self.QUERY_CACHE_THRESHOLD
+                ):
+                    return copy.deepcopy(cached_results)
+
+            memory_results = self._memory_search(query_embedding, top_k, filters)
+            if memory_results is not None:
+                self._query_cache.append(
+                    (query_embedding, cache_key, copy.deepcopy(memory_results))
+                )
+                return memory_results
+
             # ChromaDB query with optional filters
             results = self.collection.query(
-                query_texts=[query],
-                n_results=min(top_k, self.collection.count()),
+                query_embeddings=[query_embedding.tolist()],
+                n_results=min(top_k, self.count()),
                 where=filters if filters else None,
             )
 
@@ -314,18 +939,26 @@ class VectorStore:
                         }
                     )
 
+            self._query_cache.append(
+                (query_embedding, cache_key, copy.deepcopy(vector_results))
+            )
             return vector_results
 
         except Exception as e:
             logger.error(f"Vector search failed: {e}")
             return []
 
+    def clear_query_cache(self) -> None:
+        """Forget cached search answers (called whenever the index changes)."""
+        self._query_cache.clear()
+
     def clear(self) -> None:
         """Clear all vectors from store.
 
         Deletes all documents from the ChromaDB collection.
         Useful for reindexing operations.
         """
+        self.clear_query_cache()
         try:
             existing_ids = self.collection.get()["ids"]
             if existing_ids:
@@ -333,17 +966,36 @@ class VectorStore:
                 logger.info(f"Cleared {len(existing_ids)} skills from vector store")
         except Exception as e:
             logger.error(f"Failed to clear vector store: {e}")
+            # Some deletes may have gone through
+            self._count = None
             raise
 
+        # Empty again, so small enough to mirror
+        self._reset_memory_index(enabled=True)
+        self._count = 0
+        self._signature = self._collection_signature()
+
+    def close(self) -> None:
+        """Close the persistent embedding cache (safe to call twice)."""
+        if self._disk_cache is not None:
+            self._disk_cache.close()
+            self._disk_cache = None
+
     def count(self) -> int:
         """Get number of skills in vector store.
 
+        The size is cached and kept current by index_skills and clear().
+        ChromaDB is only asked again when the cached value is unknown or
+        its database file changed (e.g. another process reindexed).
+
         Returns:
             Number of indexed skills
         """
-        try:
-            count: int = self.collection.count()
-            return count
-        except Exception as e:
-            logger.error(f"Failed to count vector store: {e}")
-            return 0
+        self._sync_with_collection()
+        if self._count is None:
+            try:
+                self._count = self.collection.count()
+            except Exception as e:
+                logger.error(f"Failed to count vector store: {e}")
+                return 0
+        return self._count
@@ -21,9 +21,11 @@ Error Handling:
 - All operations use transactions for atomicity
 """
 
+import json
 import logging
 import sqlite3
-from collections.abc import Iterator
+import threading
+from collections.abc import Iterable, Iterator
 from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
@@ -33,6 +35,45 @@ from mcp_skills.models.repository import Repository
 
 logger = logging.getLogger(__name__)
 
+# Repository statements are module constants so every call passes the same
+# SQL text and hits the connection's prepared-statement cache.
+_REPO_COLUMNS = "id, url, local_path, priority, last_updated, skill_count, license"
+
+_SQL_INSERT_REPO = f"""
+    INSERT INTO repositories ({_REPO_COLUMNS})
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_INSERT_REPO_OR_IGNORE = f"""
+    INSERT OR IGNORE INTO repositories ({_REPO_COLUMNS})
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_GET_REPO = f"SELECT {_REPO_COLUMNS} FROM repositories WHERE id = ?"
+
+_SQL_LIST_REPOS = f"SELECT {_REPO_COLUMNS} FROM repositories ORDER BY priority DESC"
+
+_SQL_UPDATE_REPO = """
+    UPDATE repositories
+    SET url = ?, local_path = ?, priority = ?,
+        last_updated = ?, skill_count = ?, license = ?
+    WHERE id = ?
+"""
+
+_SQL_DELETE_REPO = "DELETE FROM repositories WHERE id = ?"
+
+_SQL_CREATE_PRIORITY_INDEX = """
+    CREATE INDEX IF NOT EXISTS idx_repos_priority
+    ON repositories(priority DESC, id)
+"""
+
+# Migrations larger than this drop idx_repos_priority during the bulk insert
+# and rebuild it once afterwards instead of updating it row by row
+_INDEX_REBUILD_THRESHOLD = 500
+
+# Stay below SQLite's default SQLITE_MAX_VARIABLE_NUMBER (999 before 3.32)
+_MAX_SQL_VARIABLES = 900
+
 
 class MetadataStore:
     """SQLite-based metadata storage for repositories and skills.
@@ -59,13 +100,22 @@ class MetadataStore:
         Args:
             db_path: Path to SQLite database file.
                     Defaults to ~/.mcp-skillset/metadata.db
+                    Path(":memory:") keeps the database in memory for the
+                    lifetime of the connection (discarded on close(); the
+                    store cannot be used afterwards)
 
         Error Handling:
         - Database creation failure: Propagates OperationalError
         - Schema initialization failure: Rolls back transaction
         """
         self.db_path = db_path or (Path.home() / ".mcp-skillset" / "metadata.db")
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        if self.db_path != Path(":memory:"):
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        # iter_repositories() cursors currently open on the shared connection
+        self._open_scans = 0
+        self._closed = False
 
         # Initialize database schema
         self._init_db()
@@ -73,18 +123,24 @@ class MetadataStore:
     def _init_db(self) -> None:
         """Initialize database schema if not exists.
 
-        Creates tables with indexes and enables foreign key constraints.
+        Creates tables with indexes.
         Uses IF NOT EXISTS to allow safe re-initialization.
 
         Design Decision: Enable Foreign Keys
 
         SQLite disables foreign keys by default for backward compatibility.
         We explicitly enable them to enforce referential integrity and
-        cascade deletes when repositories are removed.
+        cascade deletes when repositories are removed. The setting is
+        per-connection, so _get_connection applies it when connecting.
+
+        Design Decision: WAL Journal Mode
+
+        WAL lets readers proceed while a write is in progress and turns each
+        commit into a sequential append instead of a rollback-journal rewrite.
         """
         with self._get_connection() as conn:
-            # Enable foreign key constraints
-            conn.execute("PRAGMA foreign_keys = ON")
+            # WAL is persistent in the database file, so set it once here
+            conn.execute("PRAGMA journal_mode = WAL")
 
             # Create repositories table
             conn.execute(
@@ -145,13 +201,16 @@ class MetadataStore:
             """
             )
 
-            # Create indexes for fast lookups
-            conn.execute(
-                """
-                CREATE INDEX IF NOT EXISTS idx_repos_priority
-                ON repositories(priority DESC)
-            """
-            )
+            # Create indexes for fast lookups. Databases created before the
+            # id tiebreaker column was added still have the one-column
+            # priority index, so rebuild it in that case.
+            if (
+                len(conn.execute("PRAGMA index_info(idx_repos_priority)").fetchall())
+                == 1
+            ):
+                conn.execute("DROP INDEX idx_repos_priority")
+
+            conn.execute(_SQL_CREATE_PRIORITY_INDEX)
 
             conn.execute(
                 """
@@ -178,28 +237,91 @@ class MetadataStore:
 
     @contextmanager
     def _get_connection(self) -> Iterator[sqlite3.Connection]:
-        """Get database connection with context manager.
+        """Get the store's shared database connection.
 
         Yields:
             SQLite connection with row_factory set for dict-like access
 
-        Design Decision: Context Manager for Connections
+        Design Decision: One Long-Lived Connection per Store
 
-        Rationale: Use context manager to ensure connections are properly
-        closed and transactions are committed/rolled back automatically.
-        Sets row_factory to sqlite3.Row for dict-like column access.
+        Rationale: Opening a connection per operation re-opens the database,
+        WAL and shared-memory files and re-runs the PRAGMA setup every call.
+        The store keeps a single connection open until close() and serializes
+        access with a lock, so it is safe to share across threads. WAL mode
+        means other processes can still read while this one writes.
+
+        synchronous=NORMAL is durable under WAL (only the last commit can be
+        lost on power failure) and avoids an fsync per transaction.
+        temp_store=MEMORY keeps sorter and temp-index pages off disk.
 
         Error Handling:
         - Connection errors propagate to caller
-        - Transactions auto-rollback on exception
-        - Connection always closed in finally block
+        - Uncommitted changes are rolled back if the block raises
+        - Connection to a database file is reopened on next use after close()
+        - An in-memory store raises RuntimeError after close(), since its
+          database (schema included) was discarded
         """
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row
-        try:
+        with self._lock:
+            if self._conn is None:
+                if self._closed and self.db_path == Path(":memory:"):
+                    raise RuntimeError(
+                        "In-memory MetadataStore was closed and its data "
+                        "discarded; create a new store"
+                    )
+                self._conn = sqlite3.connect(
+                    str(self.db_path),
+                    check_same_thread=False,
+                    cached_statements=256,
+                )
+                self._conn.row_factory = sqlite3.Row
+                self._conn.execute("PRAGMA foreign_keys = ON")
+                self._conn.execute("PRAGMA synchronous = NORMAL")
+                self._conn.execute("PRAGMA temp_store = MEMORY")
+
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.rollback()
+                raise
+
+    @contextmanager
+    def _get_write_connection(self) -> Iterator[sqlite3.Connection]:
+        """Get the shared connection for a write.
+
+        Yields:
+            SQLite connection, as from _get_connection
+
+        Raises:
+            RuntimeError: If an iter_repositories() scan is still open; a
+                write on the same connection could make the scan skip or
+                repeat rows
+        """
+        with self._get_connection() as conn:
+            if self._open_scans:
+                raise RuntimeError(
+                    "Cannot write to the metadata store while "
+                    "iter_repositories() is in progress; exhaust or close "
+                    "the iterator first"
+                )
             yield conn
-        finally:
-            conn.close()
+
+    def close(self) -> None:
+        """Close the shared database connection.
+
+        Runs PRAGMA optimize first so SQLite can refresh planner statistics
+        (e.g. for idx_repos_priority) that drifted while this connection
+        was open. Safe to call more than once; for a database file the next
+        operation reopens it, while an in-memory store is gone for good.
+        """
+        with self._lock:
+            if self._conn is not None:
+                try:
+                    self._conn.execute("PRAGMA optimize")
+                except sqlite3.Error as e:
+                    logger.debug(f"PRAGMA optimize failed on close: {e}")
+                self._conn.close()
+                self._conn = None
+            self._closed = True
 
     # Repository CRUD Operations
 
@@ -217,25 +339,41 @@ class MetadataStore:
         - Database locked: Retries handled by SQLite default (5 seconds)
         - Transaction failure: Automatically rolled back
         """
-        with self._get_connection() as conn:
-            conn.execute(
-                """
-                INSERT INTO repositories
-                (id, url, local_path, priority, last_updated, skill_count, license)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    repository.id,
-                    repository.url,
-                    str(repository.local_path),
-                    repository.priority,
-                    repository.last_updated.isoformat(),
-                    repository.skill_count,
-                    repository.license,
-                ),
+        self.add_repositories([repository])
+        logger.debug(f"Added repository {repository.id} to metadata store")
+
+    def add_repositories(self, repositories: Iterable[Repository]) -> int:
+        """Add many new repositories in a single transaction.
+
+        Args:
+            repositories: Repository objects to persist
+
+        Returns:
+            Number of repositories inserted
+
+        Raises:
+            sqlite3.IntegrityError: If any repository ID already exists
+            RuntimeError: If an iter_repositories() scan is still open
+
+        Performance:
+        - One executemany and one commit for the whole batch instead of a
+          transaction (and fsync) per repository
+        - Prefer passing large batches (1000+ rows) for bulk imports
+
+        Error Handling:
+        - Duplicate ID: Raises IntegrityError and rolls back the whole batch
+        """
+        with self._get_write_connection() as conn:
+            changes_before = conn.total_changes
+            conn.executemany(
+                _SQL_INSERT_REPO,
+                (self._repository_to_row(repo) for repo in repositories),
             )
+            count = conn.total_changes - changes_before
             conn.commit()
-            logger.debug(f"Added repository {repository.id} to metadata store")
+
+        logger.debug(f"Added {count} repositories to metadata store")
+        return count
 
     def get_repository(self, repo_id: str) -> Repository | None:
         """Get repository by ID.
@@ -251,7 +389,7 @@ class MetadataStore:
         - No table scan required
         """
         with self._get_connection() as conn:
-            cursor = conn.execute("SELECT * FROM repositories WHERE id = ?", (repo_id,))
+            cursor = conn.execute(_SQL_GET_REPO, (repo_id,))
             row = cursor.fetchone()
 
             if not row:
@@ -259,6 +397,35 @@ class MetadataStore:
 
             return self._row_to_repository(row)
 
+    def get_repositories(self, repo_ids: list[str]) -> dict[str, Repository]:
+        """Get several repositories by ID in as few queries as possible.
+
+        Args:
+            repo_ids: Repository identifiers to look up
+
+        Returns:
+            Mapping of repository ID to Repository for the IDs that exist
+            (missing IDs are simply absent)
+
+        Performance:
+        - One WHERE id IN (...) query per 900 IDs instead of one per ID
+        - 900 stays under SQLite's default host-parameter limit
+        """
+        repositories: dict[str, Repository] = {}
+        with self._get_connection() as conn:
+            for start in range(0, len(repo_ids), _MAX_SQL_VARIABLES):
+                chunk = repo_ids[start : start + _MAX_SQL_VARIABLES]
+                placeholders = ",".join("?" * len(chunk))
+                cursor = conn.execute(
+                    f"SELECT {_REPO_COLUMNS} FROM repositories "
+                    f"WHERE id IN ({placeholders})",
+                    chunk,
+                )
+                for row in cursor:
+                    repositories[row["id"]] = self._row_to_repository(row)
+
+        return repositories
+
     def list_repositories(self) -> list[Repository]:
         """List all repositories sorted by priority.
 
@@ -266,18 +433,59 @@ class MetadataStore:
             List of Repository objects sorted by priority (highest first)
 
         Performance:
-        - Time Complexity: O(n log n) due to ORDER BY
+        - Time Complexity: O(n) index-ordered scan, no sort
         - Uses idx_repos_priority index for optimization
         - For current scale (<100 repos), this is <1ms
 
-        Index Optimization: The ORDER BY priority DESC clause uses the
-        idx_repos_priority index for efficient sorting without full table scan.
+        Index Optimization: The ORDER BY priority DESC clause walks the
+        idx_repos_priority (priority DESC, id) index in order, so SQLite
+        skips the temp B-tree sort step entirely.
+
+        All rows are fetched under one lock hold, so the result is a
+        consistent snapshot and the store may be written to afterwards.
         """
         with self._get_connection() as conn:
-            cursor = conn.execute("SELECT * FROM repositories ORDER BY priority DESC")
-            rows = cursor.fetchall()
+            rows = conn.execute(_SQL_LIST_REPOS).fetchall()
+        return [self._row_to_repository(row) for row in rows]
+
+    def iter_repositories(self, batch_size: int = 256) -> Iterator[Repository]:
+        """Iterate all repositories sorted by priority, one batch at a time.
+
+        Args:
+            batch_size: Rows fetched from the cursor per round trip
 
-            return [self._row_to_repository(row) for row in rows]
+        Yields:
+            Repository objects sorted by priority (highest first)
+
+        Performance:
+        - Peak memory is O(batch_size) instead of O(n): rows are paged with
+          fetchmany() and converted to Repository objects lazily
+        - The store lock is only held while fetching each batch, so the
+          store can still be read (e.g. get_repository) between items
+
+        Usage: The scan runs on the store's shared connection, so writes
+        (from any thread) raise RuntimeError until the iterator is
+        exhausted or close()d; use list_repositories() to modify
+        repositories while walking them. An abandoned iterator keeps its
+        read statement (and WAL snapshot) open until garbage collected.
+        """
+        with self._get_connection() as conn:
+            cursor = conn.execute(_SQL_LIST_REPOS)
+            self._open_scans += 1
+        cursor.arraysize = batch_size
+
+        try:
+            while True:
+                with self._lock:
+                    rows = cursor.fetchmany()
+                if not rows:
+                    return
+                for row in rows:
+                    yield self._row_to_repository(row)
+        finally:
+            with self._lock:
+                self._open_scans -= 1
+                cursor.close()
 
     def update_repository(self, repository: Repository) -> None:
         """Update existing repository metadata.
@@ -287,19 +495,15 @@ class MetadataStore:
 
         Raises:
             ValueError: If repository ID not found
+            RuntimeError: If an iter_repositories() scan is still open
 
         Error Handling:
         - Repository not found: Raises ValueError
         - Transaction failure: Automatically rolled back
         """
-        with self._get_connection() as conn:
+        with self._get_write_connection() as conn:
             cursor = conn.execute(
-                """
-                UPDATE repositories
-                SET url = ?, local_path = ?, priority = ?,
-                    last_updated = ?, skill_count = ?, license = ?
-                WHERE id = ?
-                """,
+                _SQL_UPDATE_REPO,
                 (
                     repository.url,
                     str(repository.local_path),
@@ -325,14 +529,15 @@ class MetadataStore:
 
         Raises:
             ValueError: If repository not found
+            RuntimeError: If an iter_repositories() scan is still open
 
         Data Consistency:
         - Uses ON DELETE CASCADE to remove related skills automatically
         - Transaction ensures atomic deletion (all or nothing)
         - No orphaned skill records possible
         """
-        with self._get_connection() as conn:
-            cursor = conn.execute("DELETE FROM repositories WHERE id = ?", (repo_id,))
+        with self._get_write_connection() as conn:
+            cursor = conn.execute(_SQL_DELETE_REPO, (repo_id,))
 
             if cursor.rowcount == 0:
                 raise ValueError(f"Repository not found: {repo_id}")
@@ -397,71 +602,70 @@ class MetadataStore:
         """Migrate repository data from JSON file to SQLite.
 
         Args:
-            json_path: Path to repos.json file
+            json_path: Path to repos.json file, either the legacy
+                {"repositories": [...]} document or line-delimited JSON
+                (one repository object per line)
 
         Returns:
             Number of repositories migrated
 
         Error Handling:
         - JSON parse errors: Logs error and returns 0
-        - Duplicate entries: Skips and logs warning
+        - Duplicate entries: Skipped and not counted in the result
         - Transaction failure: Rolls back all changes (atomic migration)
 
         Migration Strategy:
         - Atomic migration: Either all repos migrate or none
         - Preserves all repository metadata
         - Idempotent: Safe to run multiple times (skips duplicates)
+
+        Performance:
+        - Single executemany inside one transaction (one commit/fsync total
+          instead of one per repository)
+        - INSERT OR IGNORE skips IDs already stored or repeated within the
+          JSON file, so no separate existence check is needed; the count
+          comes from the connection's total_changes delta
+        - Rows are generated lazily while executemany consumes them, so no
+          intermediate list of Repository objects is built; ND-JSON files
+          are also parsed line by line as they are inserted, keeping memory
+          bounded regardless of file size
+        - Above _INDEX_REBUILD_THRESHOLD entries, idx_repos_priority is
+          dropped for the insert and rebuilt once in the same transaction
+          and the WAL is checkpointed and truncated afterwards
         """
         if not json_path.exists():
             logger.warning(f"JSON file not found for migration: {json_path}")
             return 0
 
-        import json
-
         try:
-            with open(json_path) as f:
-                data = json.load(f)
-
-            repositories = []
-            for repo_data in data.get("repositories", []):
-                try:
-                    repo = Repository.from_dict(repo_data)
-                    repositories.append(repo)
-                except (KeyError, ValueError) as e:
-                    logger.warning(f"Skipping malformed repository entry: {e}")
-
-            # Atomic migration using transaction
-            with self._get_connection() as conn:
-                migrated_count = 0
-                for repo in repositories:
-                    try:
-                        conn.execute(
-                            """
-                            INSERT INTO repositories
-                            (id, url, local_path, priority, last_updated,
-                             skill_count, license)
-                            VALUES (?, ?, ?, ?, ?, ?, ?)
-                            """,
-                            (
-                                repo.id,
-                                repo.url,
-                                str(repo.local_path),
-                                repo.priority,
-                                repo.last_updated.isoformat(),
-                                repo.skill_count,
-                                repo.license,
-                            ),
-                        )
-                        migrated_count += 1
-                    except sqlite3.IntegrityError:
-                        # Skip duplicate entries
-                        logger.debug(f"Skipping duplicate repository: {repo.id}")
+            entries, total = self._open_migration_entries(json_path)
+            rebuild_index = total > _INDEX_REBUILD_THRESHOLD
+
+            # Atomic migration using a single transaction. BEGIN is explicit
+            # so the index DDL is rolled back together with the inserts.
+            with self._get_write_connection() as conn:
+                conn.execute("BEGIN")
+                if rebuild_index:
+                    conn.execute("DROP INDEX IF EXISTS idx_repos_priority")
+
+                changes_before = conn.total_changes
+                conn.executemany(
+                    _SQL_INSERT_REPO_OR_IGNORE,
+                    self._iter_migration_rows(entries),
+                )
+                # Duplicates are ignored, so only inserted rows count
+                migrated_count = conn.total_changes - changes_before
 
+                if rebuild_index:
+                    conn.execute(_SQL_CREATE_PRIORITY_INDEX)
                 conn.commit()
 
+                # Large migrations leave a big WAL; fold it back and truncate
+                if rebuild_index:
+                    conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
             logger.info(
-                f"Migrated {migrated_count}/{len(repositories)} repositories "
-                f"from JSON to SQLite"
+                f"Migrated {migrated_count}/{total} repositories from JSON to SQLite"
             )
             return migrated_count
 
@@ -485,21 +689,118 @@ class MetadataStore:
 
     # Helper Methods
 
+    def _open_migration_entries(self, json_path: Path) -> tuple[Iterator[dict], int]:
+        """Read repository entries from a JSON or ND-JSON migration file.
+
+        Args:
+            json_path: Migration file path
+
+        Returns:
+            Repository dictionaries in file order and their number. ND-JSON
+            entries are parsed lazily as the iterator is consumed; the count
+            comes from a pre-pass over the non-blank lines, without parsing.
+
+        Format Detection: If the first non-blank line is by itself a
+        complete JSON object without a "repositories" key, the file is
+        treated as ND-JSON; otherwise it is parsed as one document.
+
+        Raises:
+            json.JSONDecodeError: If the file is not valid JSON/ND-JSON
+                (for ND-JSON, raised while the iterator is consumed)
+        """
+        with open(json_path) as f:
+            first_line = next((line for line in f if line.strip()), "")
+            try:
+                first = json.loads(first_line)
+            except json.JSONDecodeError:
+                first = None
+
+            if isinstance(first, dict) and "repositories" not in first:
+                f.seek(0)
+                total = sum(1 for line in f if line.strip())
+                return self._iter_ndjson_entries(json_path), total
+
+            f.seek(0)
+            entries: list[dict] = json.load(f).get("repositories", [])
+            return iter(entries), len(entries)
+
+    def _iter_ndjson_entries(self, json_path: Path) -> Iterator[dict]:
+        """Yield one repository dictionary per non-blank ND-JSON line.
+
+        Args:
+            json_path: ND-JSON migration file path
+
+        Yields:
+            Parsed repository dictionaries in file order
+        """
+        with open(json_path) as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+    def _iter_migration_rows(
+        self, entries: Iterable[dict]
+    ) -> Iterator[tuple[str, str, str, int, str, int, str]]:
+        """Yield INSERT parameter tuples for JSON repository entries.
+
+        Args:
+            entries: Repository dictionaries from repos.json
+
+        Yields:
+            Column tuples in repositories table order
+
+        Error Handling:
+        - Malformed entries: Logged as warning and skipped
+        """
+        for repo_data in entries:
+            try:
+                repo = Repository.from_dict(repo_data)
+            except (KeyError, ValueError) as e:
+                logger.warning(f"Skipping malformed repository entry: {e}")
+                continue
+
+            yield self._repository_to_row(repo)
+
+    def _repository_to_row(
+        self, repository: Repository
+    ) -> tuple[str, str, str, int, str, int, str]:
+        """Convert Repository object to INSERT parameters.
+
+        Args:
+            repository: Repository to serialize
+
+        Returns:
+            Column values in _REPO_COLUMNS order
+        """
+        return (
+            repository.id,
+            repository.url,
+            str(repository.local_path),
+            repository.priority,
+            repository.last_updated.isoformat(),
+            repository.skill_count,
+            repository.license,
+        )
+
     def _row_to_repository(self, row: sqlite3.Row) -> Repository:
         """Convert SQLite row to Repository object.
 
         Args:
-            row: SQLite Row object from query
+            row: SQLite Row object from a query selecting _REPO_COLUMNS
 
         Returns:
             Repository instance with data from row
+
+        Performance: Unpacks the row positionally (column order is fixed by
+        _REPO_COLUMNS), avoiding a by-name lookup per field.
         """
+        repo_id, url, local_path, priority, last_updated, skill_count, license_ = row
         return Repository(
-            id=row["id"],
-            url=row["url"],
-            local_path=Path(row["local_path"]),
-            priority=row["priority"],
-            last_updated=datetime.fromisoformat(row["last_updated"]),
-            skill_count=row["skill_count"],
-            license=row["license"],
+            repo_id,
+            url,
+            Path(local_path),
+            priority,
+            datetime.fromisoformat(last_updated),
+            skill_count,
+            license_,
         )
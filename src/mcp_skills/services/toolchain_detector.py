@@ -1,10 +1,14 @@
 """Toolchain detection service for identifying project technology stack."""
 
+import copy
 import json
 import logging
+import os
+from collections import OrderedDict
+from collections.abc import Set as AbstractSet
 from dataclasses import dataclass
 from pathlib import Path
-from typing import TypedDict
+from typing import NamedTuple, TypedDict
 
 
 logger = logging.getLogger(__name__)
@@ -19,7 +23,45 @@ class ToolchainPattern(TypedDict):
     priority: float
 
 
-@dataclass
+class _CompiledPattern(NamedTuple):
+    """Per-language markers flattened once from a ToolchainPattern."""
+
+    markers: tuple[tuple[str, float], ...]
+    priority: float
+    theoretical_max: float
+
+
+def _compile_patterns(
+    patterns: dict[str, ToolchainPattern],
+) -> dict[str, _CompiledPattern]:
+    """Flatten toolchain patterns into (marker name, weight) tuples.
+
+    Args:
+        patterns: Detection patterns keyed by language
+
+    Returns:
+        Compiled pattern per language, with markers in files/dirs/configs
+        order and the priority-weighted theoretical maximum precomputed
+    """
+    compiled = {}
+    for language, pattern in patterns.items():
+        markers = (
+            *((name, 0.4) for name in pattern["files"]),
+            *((name, 0.2) for name in pattern["dirs"]),
+            *((name, 0.1) for name in pattern["configs"]),
+        )
+        theoretical_max = (
+            len(pattern["files"]) * 0.4
+            + len(pattern["dirs"]) * 0.2
+            + len(pattern["configs"]) * 0.1
+        ) * pattern["priority"]
+        compiled[language] = _CompiledPattern(
+            markers, pattern["priority"], theoretical_max
+        )
+    return compiled
+
+
+@dataclass(slots=True)
 class ToolchainInfo:
     """Detected toolchain information.
 
@@ -83,6 +125,31 @@ class ToolchainDetector:
         },
     }
 
+    # TOOLCHAIN_PATTERNS flattened once at class load for scoring
+    _COMPILED_PATTERNS = _compile_patterns(TOOLCHAIN_PATTERNS)
+
+    # Root files whose contents (not just presence) affect detection
+    _CONTENT_FILES = frozenset(
+        {
+            "package.json",
+            "pyproject.toml",
+            "requirements.txt",
+            "requirements-dev.txt",
+            "requirements-prod.txt",
+            "Cargo.toml",
+            "go.mod",
+        }
+    )
+
+    # Maximum number of project signatures kept by detect()
+    DETECT_CACHE_SIZE = 128
+
+    def __init__(self) -> None:
+        """Initialize detector with an empty detection cache."""
+        self._detect_cache: OrderedDict[tuple[object, ...], ToolchainInfo] = (
+            OrderedDict()
+        )
+
     def detect(self, project_dir: Path) -> ToolchainInfo:
         """Analyze project directory and return toolchain information.
 
@@ -96,6 +163,10 @@ class ToolchainDetector:
             detector = ToolchainDetector()
             info = detector.detect(Path("/path/to/project"))
             print(f"Primary language: {info.primary_language}")
+
+        Performance: Results are memoized per project signature (root
+        entry names plus mtime/size of the files whose contents are parsed),
+        so repeat calls on an unchanged project skip detection entirely.
         """
         if not project_dir.exists() or not project_dir.is_dir():
             logger.warning(f"Project directory does not exist: {project_dir}")
@@ -109,8 +180,41 @@ class ToolchainDetector:
                 confidence=0.0,
             )
 
+        # List the project root once and share it across all detectors
+        entries = self._list_entries(project_dir)
+
+        # Reuse the previous result if nothing detection looks at changed
+        key = self._signature(project_dir, entries)
+        cached = self._detect_cache.get(key)
+        if cached is None:
+            cached = self._detect_uncached(project_dir, entries)
+            self._detect_cache[key] = cached
+            if len(self._detect_cache) > self.DETECT_CACHE_SIZE:
+                self._detect_cache.popitem(last=False)
+        else:
+            self._detect_cache.move_to_end(key)
+
+        # Callers may mutate the returned lists, so never hand out the cached one
+        return copy.deepcopy(cached)
+
+    def clear_cache(self) -> None:
+        """Forget memoized detect() results (e.g. to force a rescan)."""
+        self._detect_cache.clear()
+
+    def _detect_uncached(
+        self, project_dir: Path, entries: AbstractSet[str]
+    ) -> ToolchainInfo:
+        """Run full toolchain detection for an existing project directory.
+
+        Args:
+            project_dir: Path to project root directory
+            entries: Root entry names from _list_entries
+
+        Returns:
+            ToolchainInfo with detected languages, frameworks, and tools
+        """
         # Calculate confidence scores for each language
-        language_scores = self._calculate_language_scores(project_dir)
+        language_scores = self._calculate_language_scores(project_dir, entries)
 
         # Determine primary and secondary languages
         if not language_scores:
@@ -133,14 +237,18 @@ class ToolchainDetector:
             ]
 
         # Detect frameworks
-        frameworks = self.detect_frameworks(project_dir)
+        frameworks = self.detect_frameworks(project_dir, entries)
 
         # Detect build tools and package managers
-        build_tools = self._detect_build_tools(project_dir, language_scores)
-        package_managers = self._detect_package_managers(project_dir, language_scores)
+        build_tools = self._detect_build_tools(project_dir, language_scores, entries)
+        package_managers = self._detect_package_managers(
+            project_dir, language_scores, entries
+        )
 
         # Detect test frameworks
-        test_frameworks = self._detect_test_frameworks(project_dir, language_scores)
+        test_frameworks = self._detect_test_frameworks(
+            project_dir, language_scores, entries
+        )
 
         return ToolchainInfo(
             primary_language=primary_language,
@@ -175,7 +283,9 @@ class ToolchainDetector:
 
         return detected_languages
 
-    def detect_frameworks(self, project_dir: Path) -> list[str]:
+    def detect_frameworks(
+        self, project_dir: Path, entries: AbstractSet[str] | None = None
+    ) -> list[str]:
         """Identify frameworks used in project.
 
         Parses package files (package.json, requirements.txt, etc.)
@@ -183,23 +293,27 @@ class ToolchainDetector:
 
         Args:
             project_dir: Path to project root
+            entries: Root entry names from _list_entries (listed if omitted)
 
         Returns:
             List of detected framework names
         """
+        if entries is None:
+            entries = self._list_entries(project_dir)
+
         frameworks = []
 
         # Python frameworks
-        frameworks.extend(self._detect_python_frameworks(project_dir))
+        frameworks.extend(self._detect_python_frameworks(project_dir, entries))
 
         # JavaScript/TypeScript frameworks
-        frameworks.extend(self._detect_js_frameworks(project_dir))
+        frameworks.extend(self._detect_js_frameworks(project_dir, entries))
 
         # Rust frameworks
-        frameworks.extend(self._detect_rust_frameworks(project_dir))
+        frameworks.extend(self._detect_rust_frameworks(project_dir, entries))
 
         # Go frameworks
-        frameworks.extend(self._detect_go_frameworks(project_dir))
+        frameworks.extend(self._detect_go_frameworks(project_dir, entries))
 
         return frameworks
 
@@ -251,7 +365,53 @@ class ToolchainDetector:
 
     # Private helper methods
 
-    def _calculate_language_scores(self, project_dir: Path) -> dict[str, float]:
+    def _list_entries(self, project_dir: Path) -> frozenset[str]:
+        """List names directly inside the project root in one pass.
+
+        All toolchain markers are root-level names, so one os.scandir call
+        replaces the dozens of per-marker Path.exists() stat calls a full
+        detection would otherwise make.
+
+        Args:
+            project_dir: Path to project root
+
+        Returns:
+            Names of files and directories in project_dir (empty if the
+            directory cannot be read)
+        """
+        try:
+            with os.scandir(project_dir) as it:
+                return frozenset(entry.name for entry in it)
+        except OSError as e:
+            logger.debug(f"Failed to list {project_dir}: {e}")
+            return frozenset()
+
+    def _signature(
+        self, project_dir: Path, entries: frozenset[str]
+    ) -> tuple[object, ...]:
+        """Build the detect() cache key for a project directory.
+
+        Args:
+            project_dir: Path to project root
+            entries: Root entry names from _list_entries
+
+        Returns:
+            Hashable key that changes when any root entry is added or
+            removed, or when a parsed content file is modified
+        """
+        content_stats = []
+        for name in sorted(entries & self._CONTENT_FILES):
+            try:
+                stat = (project_dir / name).stat()
+            except OSError:
+                continue
+            content_stats.append((name, stat.st_mtime_ns, stat.st_size))
+
+        return (str(project_dir.resolve()), entries, tuple(content_stats))
+
+    def _calculate_language_scores(
+        self, project_dir: Path, entries: AbstractSet[str] | None = None
+    ) -> dict[str, float]:
         """Calculate confidence scores for each language based on pattern matching.
 
         Weights:
@@ -264,43 +424,30 @@ class ToolchainDetector:
 
         Args:
             project_dir: Path to project root
+            entries: Root entry names from _list_entries (listed if omitted)
 
         Returns:
             Dictionary mapping language name to normalized confidence score (0.0-1.0)
         """
+        if entries is None:
+            entries = self._list_entries(project_dir)
+
         scores: dict[str, float] = {}
 
-        for language, patterns in self.TOOLCHAIN_PATTERNS.items():
+        for language, compiled in self._COMPILED_PATTERNS.items():
             score = 0.0
 
-            # Check for marker files (0.4 weight each)
-            for file_name in patterns["files"]:
-                if (project_dir / file_name).exists():
-                    score += 0.4
-
-            # Check for directories (0.2 weight each)
-            for dir_name in patterns["dirs"]:
-                if (project_dir / dir_name).exists():
-                    score += 0.2
-
-            # Check for config files (0.1 weight each)
-            for config_name in patterns["configs"]:
-                if (project_dir / config_name).exists():
-                    score += 0.1
+            # Marker files 0.4, directories 0.2, config files 0.1 each
+            for name, weight in compiled.markers:
+                if name in entries:
+                    score += weight
 
             # Apply language priority multiplier
-            score *= patterns["priority"]
+            score *= compiled.priority
 
             if score > 0:
                 # Normalize by theoretical maximum to ensure score <= 1.0
-                # Theoretical max = (num_files * 0.4 + num_dirs * 0.2 + num_configs * 0.1) * priority
-                theoretical_max = (
-                    len(patterns["files"]) * 0.4
-                    + len(patterns["dirs"]) * 0.2
-                    + len(patterns["configs"]) * 0.1
-                ) * patterns["priority"]
-
-                # Normalize score to [0.0, 1.0] range
+                theoretical_max = compiled.theoretical_max
                 normalized_score = (
                     min(score / theoretical_max, 1.0) if theoretical_max > 0 else 0.0
                 )
@@ -309,30 +456,37 @@ class ToolchainDetector:
         return scores
 
     def _detect_build_tools(
-        self, project_dir: Path, language_scores: dict[str, float]
+        self,
+        project_dir: Path,
+        language_scores: dict[str, float],
+        entries: AbstractSet[str] | None = None,
     ) -> list[str]:
         """Detect build tools based on detected languages and marker files.
 
         Args:
             project_dir: Path to project root
             language_scores: Calculated language confidence scores
+            entries: Root entry names from _list_entries (listed if omitted)
 
         Returns:
             List of detected build tool names
         """
+        if entries is None:
+            entries = self._list_entries(project_dir)
+
         build_tools = []
 
         # Python build tools
         if "Python" in language_scores:
-            if (project_dir / "setup.py").exists():
+            if "setup.py" in entries:
                 build_tools.append("setuptools")
-            if (project_dir / "pyproject.toml").exists():
+            if "pyproject.toml" in entries:
                 build_tools.append("poetry")
 
         # JavaScript/TypeScript build tools
         if "JavaScript" in language_scores or "TypeScript" in language_scores:
             package_json = project_dir / "package.json"
-            if package_json.exists():
+            if "package.json" in entries:
                 try:
                     with open(package_json) as f:
                         data = json.load(f)
@@ -352,87 +506,99 @@ class ToolchainDetector:
                     logger.debug(f"Failed to parse package.json: {e}")
 
         # Rust build tools
-        if "Rust" in language_scores and (project_dir / "Cargo.toml").exists():
+        if "Rust" in language_scores and "Cargo.toml" in entries:
             build_tools.append("cargo")
 
         # Go build tools
-        if "Go" in language_scores and (project_dir / "go.mod").exists():
+        if "Go" in language_scores and "go.mod" in entries:
             build_tools.append("go")
 
         return build_tools
 
     def _detect_package_managers(
-        self, project_dir: Path, language_scores: dict[str, float]
+        self,
+        project_dir: Path,
+        language_scores: dict[str, float],
+        entries: AbstractSet[str] | None = None,
     ) -> list[str]:
         """Detect package managers based on lock files and marker files.
 
         Args:
             project_dir: Path to project root
             language_scores: Calculated language confidence scores
+            entries: Root entry names from _list_entries (listed if omitted)
 
         Returns:
             List of detected package manager names
         """
+        if entries is None:
+            entries = self._list_entries(project_dir)
+
         package_managers = []
 
         # Python package managers
         if "Python" in language_scores:
-            if (project_dir / "requirements.txt").exists():
+            if "requirements.txt" in entries:
                 package_managers.append("pip")
-            if (project_dir / "Pipfile").exists():
+            if "Pipfile" in entries:
                 package_managers.append("pipenv")
-            if (project_dir / "poetry.lock").exists():
+            if "poetry.lock" in entries:
                 package_managers.append("poetry")
-            if (project_dir / "pdm.lock").exists():
+            if "pdm.lock" in entries:
                 package_managers.append("pdm")
 
         # JavaScript/TypeScript package managers
         if "JavaScript" in language_scores or "TypeScript" in language_scores:
-            if (project_dir / "package-lock.json").exists():
+            if "package-lock.json" in entries:
                 package_managers.append("npm")
-            if (project_dir / "yarn.lock").exists():
+            if "yarn.lock" in entries:
                 package_managers.append("yarn")
-            if (project_dir / "pnpm-lock.yaml").exists():
+            if "pnpm-lock.yaml" in entries:
                 package_managers.append("pnpm")
 
         # Rust package manager
-        if "Rust" in language_scores and (project_dir / "Cargo.lock").exists():
+        if "Rust" in language_scores and "Cargo.lock" in entries:
             package_managers.append("cargo")
 
         # Go package manager
-        if "Go" in language_scores and (project_dir / "go.sum").exists():
+        if "Go" in language_scores and "go.sum" in entries:
             package_managers.append("go modules")
 
         return package_managers
 
     def _detect_test_frameworks(
-        self, project_dir: Path, language_scores: dict[str, float]
+        self,
+        project_dir: Path,
+        language_scores: dict[str, float],
+        entries: AbstractSet[str] | None = None,
     ) -> list[str]:
         """Detect test frameworks based on config files and dependencies.
 
         Args:
             project_dir: Path to project root
             language_scores: Calculated language confidence scores
+            entries: Root entry names from _list_entries (listed if omitted)
 
         Returns:
             List of detected test framework names
         """
+        if entries is None:
+            entries = self._list_entries(project_dir)
+
         test_frameworks = []
 
         # Python test frameworks
         if "Python" in language_scores:
-            if (project_dir / "pytest.ini").exists() or (
-                project_dir / "pyproject.toml"
-            ).exists():
+            if "pytest.ini" in entries or "pyproject.toml" in entries:
                 # Check if pytest is in requirements
                 test_frameworks.append("pytest")
-            if (project_dir / "tox.ini").exists():
+            if "tox.ini" in entries:
                 test_frameworks.append("tox")
 
             # Check requirements files for test frameworks
             for req_file in ["requirements.txt", "requirements-dev.txt"]:
                 req_path = project_dir / req_file
-                if req_path.exists():
+                if req_file in entries:
                     try:
                         content = req_path.read_text()
                         if (
@@ -448,7 +614,7 @@ class ToolchainDetector:
         # JavaScript/TypeScript test frameworks
         if "JavaScript" in language_scores or "TypeScript" in language_scores:
             package_json = project_dir / "package.json"
-            if package_json.exists():
+            if "package.json" in entries:
                 try:
                     with open(package_json) as f:
                         data = json.load(f)
@@ -482,15 +648,21 @@ class ToolchainDetector:
 
         return test_frameworks
 
-    def _detect_python_frameworks(self, project_dir: Path) -> list[str]:
+    def _detect_python_frameworks(
+        self, project_dir: Path, entries: AbstractSet[str] | None = None
+    ) -> list[str]:
         """Detect Python frameworks from requirements files and pyproject.toml.
 
         Args:
             project_dir: Path to project root
+            entries: Root entry names from _list_entries (listed if omitted)
 
         Returns:
             List of detected Python framework names
         """
+        if entries is None:
+            entries = self._list_entries(project_dir)
+
         frameworks = []
         framework_patterns = {
             "Flask": ["flask"],
@@ -512,7 +684,7 @@ class ToolchainDetector:
             "requirements-prod.txt",
         ]:
             req_path = project_dir / req_file
-            if req_path.exists():
+            if req_file in entries:
                 try:
                     content = req_path.read_text().lower()
                     for framework, patterns in framework_patterns.items():
@@ -526,7 +698,7 @@ class ToolchainDetector:
 
         # Check pyproject.toml
         pyproject = project_dir / "pyproject.toml"
-        if pyproject.exists():
+        if "pyproject.toml" in entries:
             try:
                 content = pyproject.read_text().lower()
                 for framework, patterns in framework_patterns.items():
@@ -540,19 +712,25 @@ class ToolchainDetector:
 
         return frameworks
 
-    def _detect_js_frameworks(self, project_dir: Path) -> list[str]:
+    def _detect_js_frameworks(
+        self, project_dir: Path, entries: AbstractSet[str] | None = None
+    ) -> list[str]:
         """Detect JavaScript/TypeScript frameworks from package.json.
 
         Args:
             project_dir: Path to project root
+            entries: Root entry names from _list_entries (listed if omitted)
 
         Returns:
             List of detected JS/TS framework names
         """
+        if entries is None:
+            entries = self._list_entries(project_dir)
+
         frameworks: list[str] = []
         package_json = project_dir / "package.json"
 
-        if not package_json.exists():
+        if "package.json" not in entries:
             return frameworks
 
         try:
@@ -592,19 +770,25 @@ class ToolchainDetector:
 
         return frameworks
 
-    def _detect_rust_frameworks(self, project_dir: Path) -> list[str]:
+    def _detect_rust_frameworks(
+        self, project_dir: Path, entries: AbstractSet[str] | None = None
+    ) -> list[str]:
         """Detect Rust frameworks from Cargo.toml.
 
         Args:
             project_dir: Path to project root
+            entries: Root entry names from _list_entries (listed if omitted)
 
         Returns:
             List of detected Rust framework names
         """
+        if entries is None:
+            entries = self._list_entries(project_dir)
+
         frameworks: list[str] = []
         cargo_toml = project_dir / "Cargo.toml"
 
-        if not cargo_toml.exists():
+        if "Cargo.toml" not in entries:
             return frameworks
 
         try:
@@ -633,19 +817,25 @@ class ToolchainDetector:
 
         return frameworks
 
-    def _detect_go_frameworks(self, project_dir: Path) -> list[str]:
+    def _detect_go_frameworks(
+        self, project_dir: Path, entries: AbstractSet[str] | None = None
+    ) -> list[str]:
         """Detect Go frameworks from go.mod.
 
         Args:
             project_dir: Path to project root
+            entries: Root entry names from _list_entries (listed if omitted)
 
         Returns:
             List of detected Go framework names
         """
+        if entries is None:
+            entries = self._list_entries(project_dir)
+
         frameworks: list[str] = []
         go_mod = project_dir / "go.mod"
 
-        if not go_mod.exists():
+        if "go.mod" not in entries:
             return frameworks
 
         try:
@@ -1,9 +1,22 @@
 """Logging configuration for mcp-skillset."""
 
+import functools
 import logging
 import sys
 
 
+# Format: timestamp - name - level - message. Formatters hold no per-handler
+# state, so one instance is shared by every handler setup_logger creates.
+_FORMATTER = logging.Formatter(
+    "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+
+# Last configuration applied by setup_logger, keyed by logger name:
+# (level number, log file, handlers installed)
+_CONFIGURED: dict[str, tuple[int, str | None, tuple[logging.Handler, ...]]] = {}
+
+
 def setup_logger(
     name: str = "mcp_skills",
     level: str = "INFO",
@@ -18,38 +31,56 @@ def setup_logger(
 
     Returns:
         Configured logger instance
+
+    Repeat calls with the same name, level and log_file return the logger
+    unchanged, as long as its level and handlers are still the ones this
+    function installed and sys.stdout has not been swapped (e.g. by a test
+    runner); anything else triggers a full reconfigure.
     """
     logger = logging.getLogger(name)
-    logger.setLevel(getattr(logging, level.upper()))
+    levelno = getattr(logging, level.upper())
+
+    # Fast path: already configured exactly like this
+    cached = _CONFIGURED.get(name)
+    if (
+        cached is not None
+        and cached[:2] == (levelno, log_file)
+        and logger.level == levelno
+        and tuple(logger.handlers) == cached[2]
+        and cached[2][0].stream is sys.stdout  # type: ignore[attr-defined]
+    ):
+        return logger
+
+    logger.setLevel(levelno)
 
     # Remove existing handlers
     logger.handlers.clear()
 
     # Console handler with formatting
     console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(getattr(logging, level.upper()))
-
-    # Format: timestamp - name - level - message
-    formatter = logging.Formatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
-    console_handler.setFormatter(formatter)
+    console_handler.setLevel(levelno)
+
+    console_handler.setFormatter(_FORMATTER)
     logger.addHandler(console_handler)
 
     # File handler if specified
     if log_file:
         file_handler = logging.FileHandler(log_file)
-        file_handler.setLevel(getattr(logging, level.upper()))
-        file_handler.setFormatter(formatter)
+        file_handler.setLevel(levelno)
+        file_handler.setFormatter(_FORMATTER)
         logger.addHandler(file_handler)
 
+    _CONFIGURED[name] = (levelno, log_file, tuple(logger.handlers))
     return logger
 
 
+@functools.cache
 def get_logger(name: str = "mcp_skills") -> logging.Logger:
     """Get logger instance.
 
+    Cached per name: logging.getLogger already returns one logger per name,
+    so the cache only skips its module-level lock on repeat calls.
+
     Args:
         name: Logger name
 
@@ -2,18 +2,34 @@
 
 from __future__ import annotations
 
-from collections.abc import Generator
+import functools
+from collections.abc import Callable, Generator
 from pathlib import Path
+from types import SimpleNamespace
 from typing import TYPE_CHECKING
-from unittest.mock import Mock
+from unittest.mock import Mock, create_autospec
 
+import click
 import pytest
 from click.testing import CliRunner
 
+import mcp_skills.cli.commands.enrich as enrich_cmd
+import mcp_skills.cli.commands.index as index_cmd
+import mcp_skills.cli.commands.info as info_cmd
+import mcp_skills.cli.commands.install as install_cmd
+import mcp_skills.cli.commands.list_skills as list_cmd
+import mcp_skills.cli.commands.recommend as recommend_cmd
+import mcp_skills.cli.commands.search as search_cmd
+import mcp_skills.cli.commands.stats as stats_cmd
+from mcp_skills.cli.main import cli
 from mcp_skills.models.config import HybridSearchConfig, MCPSkillsConfig
 from mcp_skills.models.repository import Repository
 from mcp_skills.models.skill import Skill
+from mcp_skills.services.agent_detector import AgentDetector
+from mcp_skills.services.agent_installer import AgentInstaller, InstallResult
+from mcp_skills.services.indexing.engine import IndexStats
 from mcp_skills.services.indexing.hybrid_search import ScoredSkill
+from mcp_skills.services.prompt_enricher import EnrichedPrompt
 from mcp_skills.services.toolchain_detector import ToolchainInfo
 
 
@@ -21,16 +37,75 @@ if TYPE_CHECKING:
     pass
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def cli_runner() -> CliRunner:
-    """Provide Click test runner."""
+    """Provide Click test runner.
+
+    ``CliRunner`` keeps no per-invocation state (each ``invoke`` builds its
+    own context and isolated streams), so one runner is shared per module.
+    """
     return CliRunner()
 
 
+@functools.cache
+def _render_help(cmd_path: tuple[str, ...]) -> str:
+    """Render ``--help`` output for a command path once per session.
+
+    Builds the Click context chain directly and calls ``get_help`` so no
+    runner, stream capture or ``Result`` is involved.
+    """
+    command: click.Command | None = cli
+    ctx = click.Context(cli, info_name="cli")
+    for name in cmd_path:
+        assert isinstance(command, click.Group), cmd_path
+        command = command.get_command(ctx, name)
+        assert command is not None, cmd_path
+        ctx = click.Context(command, info_name=name, parent=ctx)
+    assert command is not None
+    return command.get_help(ctx)
+
+
 @pytest.fixture
-def mock_config(tmp_path: Path) -> MCPSkillsConfig:
-    """Provide mock configuration."""
-    config_dir = tmp_path / ".mcp-skillset"
+def cli_help() -> Callable[[tuple[str, ...]], str]:
+    """Provide cached ``--help`` output keyed by command path.
+
+    Example: ``cli_help(("index",))`` or ``cli_help(())`` for the root group.
+    """
+    return _render_help
+
+
+@pytest.fixture
+def invoke_fast() -> Callable[[list[str]], int]:
+    """Provide exit-code-only CLI invocation.
+
+    Calls ``cli.main`` with ``standalone_mode=False`` so no stream capture or
+    ``Result`` object is built. Use ``cli_runner`` for tests that assert
+    against the command output.
+    """
+
+    def _invoke(args: list[str]) -> int:
+        try:
+            cli.main(args, standalone_mode=False)
+        except SystemExit as e:
+            if e.code is None:
+                return 0
+            return e.code if isinstance(e.code, int) else 1
+        except click.ClickException as e:
+            return e.exit_code
+        return 0
+
+    return _invoke
+
+
+@pytest.fixture(scope="session")
+def mock_config(tmp_path_factory: pytest.TempPathFactory) -> MCPSkillsConfig:
+    """Provide mock configuration.
+
+    Session-scoped: the CLI commands only read it. Tests that need different
+    values should build their own ``MCPSkillsConfig`` instead of mutating
+    this one.
+    """
+    config_dir = tmp_path_factory.mktemp("config") / ".mcp-skillset"
     config_dir.mkdir(parents=True, exist_ok=True)
 
     # Create actual config object with real values (not Mocks)
@@ -52,9 +127,9 @@ def mock_config(tmp_path: Path) -> MCPSkillsConfig:
     return config
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_toolchain_info() -> ToolchainInfo:
-    """Provide mock toolchain info."""
+    """Provide mock toolchain info (session-scoped, treat as read-only)."""
     return ToolchainInfo(
         primary_language="Python",
         secondary_languages=["TypeScript"],
@@ -66,9 +141,9 @@ def mock_toolchain_info() -> ToolchainInfo:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_skill() -> Skill:
-    """Provide mock skill."""
+    """Provide mock skill (session-scoped, treat as read-only)."""
     return Skill(
         id="test-skill",
         name="Test Skill",
@@ -124,11 +199,15 @@ def mock_indexing_engine(mock_skill: Skill) -> Generator[Mock, None, None]:
     # Return list of ScoredSkill objects for search
     scored_skill = ScoredSkill(skill=mock_skill, score=0.95, match_type="hybrid")
     engine.search.return_value = [scored_skill]
-    engine.get_stats.return_value = {
-        "total_skills": 10,
-        "total_embeddings": 100,
-        "index_size_mb": 1.5,
-    }
+    stats = IndexStats(
+        total_skills=10,
+        vector_store_size=5632,  # bytes
+        graph_nodes=10,
+        graph_edges=15,
+        last_indexed="2025-01-01T00:00:00",
+    )
+    engine.reindex_all.return_value = stats
+    engine.get_stats.return_value = stats
     yield engine
 
 
@@ -154,22 +233,166 @@ def mock_toolchain_detector(
     yield detector
 
 
+# Autospecs are built once at import (introspecting the class each time is
+# the expensive part) and reset by the fixtures before every test.
+_AGENT_INSTALLER_SPEC = create_autospec(AgentInstaller, spec_set=True, instance=True)
+_AGENT_DETECTOR_SPEC = create_autospec(AgentDetector, spec_set=True, instance=True)
+
+
 @pytest.fixture
 def mock_agent_installer() -> Generator[Mock, None, None]:
-    """Provide mocked AgentInstaller."""
-    installer = Mock()
-    installer.install_agent.return_value = {"status": "success", "agent": "claude"}
+    """Provide mocked AgentInstaller (shared autospec, reset per test)."""
+    installer = _AGENT_INSTALLER_SPEC
+    installer.reset_mock(return_value=True, side_effect=True)
+    installer.install.return_value = InstallResult(
+        success=True,
+        agent_name="Claude Code",
+        agent_id="claude-code",
+        config_path=Path("/test/Code/User/settings.json"),
+        changes_made="Added mcp-skillset",
+    )
     yield installer
 
 
 @pytest.fixture
-def mock_prompt_enricher() -> Generator[Mock, None, None]:
+def mock_prompt_enricher(mock_skill: Skill) -> Generator[Mock, None, None]:
     """Provide mocked PromptEnricher."""
     enricher = Mock()
-    enricher.enrich_prompt.return_value = "Enriched prompt content"
+    enricher.extract_keywords.return_value = ["test", "authentication"]
+    enricher.search_skills.return_value = [mock_skill]
+    enricher.enrich.return_value = EnrichedPrompt(
+        original_prompt="Test prompt",
+        keywords=["test", "authentication"],
+        skills_found=[mock_skill],
+        enriched_text="Enriched prompt content",
+        detailed=False,
+    )
+    enricher.save_to_file.side_effect = lambda text, path: Path(path).write_text(text)
     yield enricher
 
 
+@pytest.fixture
+def enrich_services(
+    monkeypatch: pytest.MonkeyPatch,
+    mock_prompt_enricher: Mock,
+) -> Mock:
+    """Patch enrich command services with the shared mocks.
+
+    The SkillManager is only handed to the (mocked) enricher, so an empty
+    SimpleNamespace stands in for it. Returns the enricher so tests only
+    override what they exercise.
+    """
+    monkeypatch.setattr(enrich_cmd, "SkillManager", SimpleNamespace)
+    monkeypatch.setattr(
+        enrich_cmd, "PromptEnricher", Mock(return_value=mock_prompt_enricher)
+    )
+    return mock_prompt_enricher
+
+
+@pytest.fixture
+def index_services(
+    monkeypatch: pytest.MonkeyPatch,
+    mock_indexing_engine: Mock,
+) -> Mock:
+    """Patch index and stats command services with the shared mocks.
+
+    The SkillManager is only handed to the (mocked) engine, so an empty
+    SimpleNamespace stands in for it. Returns the indexing engine so tests
+    only override what they exercise.
+    """
+    for module in (index_cmd, stats_cmd):
+        monkeypatch.setattr(module, "SkillManager", SimpleNamespace)
+        monkeypatch.setattr(
+            module, "IndexingEngine", Mock(return_value=mock_indexing_engine)
+        )
+    return mock_indexing_engine
+
+
+@pytest.fixture
+def install_services(
+    monkeypatch: pytest.MonkeyPatch,
+    mock_agent_installer: Mock,
+) -> SimpleNamespace:
+    """Patch install command AgentDetector/AgentInstaller with shared mocks.
+
+    Returns a namespace with ``detector`` and ``installer`` so tests set
+    ``detect_agent``/``detect_all`` and ``install`` results directly. No test
+    asserts on the constructors, so plain factories replace class Mocks.
+    """
+    detector = _AGENT_DETECTOR_SPEC
+    detector.reset_mock(return_value=True, side_effect=True)
+    monkeypatch.setattr(install_cmd, "AgentDetector", lambda: detector)
+    monkeypatch.setattr(install_cmd, "AgentInstaller", lambda: mock_agent_installer)
+    return SimpleNamespace(detector=detector, installer=mock_agent_installer)
+
+
+@pytest.fixture
+def search_services(
+    monkeypatch: pytest.MonkeyPatch,
+    mock_indexing_engine: Mock,
+    mock_toolchain_detector: Mock,
+) -> Mock:
+    """Patch search and recommend command services with the shared mocks.
+
+    recommend also gets the shared ToolchainDetector; request
+    ``mock_toolchain_detector`` alongside this fixture to change what it
+    detects. Returns the indexing engine. No test asserts on the
+    constructors, so plain factories replace class Mocks.
+    """
+    for module in (search_cmd, recommend_cmd):
+        monkeypatch.setattr(module, "SkillManager", SimpleNamespace)
+        monkeypatch.setattr(module, "IndexingEngine", lambda **_: mock_indexing_engine)
+    monkeypatch.setattr(
+        recommend_cmd, "ToolchainDetector", lambda: mock_toolchain_detector
+    )
+    return mock_indexing_engine
+
+
+@pytest.fixture
+def mcp_services(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    """Patch the MCP server entry points the ``mcp`` command imports.
+
+    The command imports ``configure_services`` and ``main`` from
+    ``mcp_skills.mcp.server`` at call time, so the module attributes are
+    replaced. The server module is imported here rather than at the top of
+    this file so that only the mcp tests pay for loading it.
+    """
+    import mcp_skills.mcp.server as mcp_server
+
+    services = SimpleNamespace(configure_services=Mock(), main=Mock())
+    monkeypatch.setattr(mcp_server, "configure_services", services.configure_services)
+    monkeypatch.setattr(mcp_server, "main", services.main)
+    return services
+
+
+@pytest.fixture
+def skill_manager_services(
+    monkeypatch: pytest.MonkeyPatch,
+    mock_skill: Skill,
+) -> SimpleNamespace:
+    """Patch list/info command SkillManager with a plain attribute stub.
+
+    No test asserts on SkillManager calls, so a SimpleNamespace of callables
+    replaces a Mock. Tests reassign ``discover_skills``/``load_skill`` to
+    change what the commands see.
+    """
+    manager = SimpleNamespace(
+        discover_skills=lambda: [mock_skill],
+        load_skill=lambda skill_id: mock_skill,
+    )
+    for module in (list_cmd, info_cmd):
+        monkeypatch.setattr(module, "SkillManager", lambda: manager)
+    return manager
+
+
+@pytest.fixture(scope="session")
+def sample_prompt_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Provide a prompt file written once per test session."""
+    prompt_file = tmp_path_factory.mktemp("prompts") / "prompt.txt"
+    prompt_file.write_text("Write a test for authentication")
+    return prompt_file
+
+
 @pytest.fixture
 def isolated_filesystem(cli_runner: CliRunner) -> Generator[str, None, None]:
     """Provide isolated filesystem for CLI tests."""
@@ -93,9 +93,8 @@ class TestDoctorCommand:
 
         # Verify warning about no skills
         assert result.exit_code == 0
-        assert (
-            "no skills" in result.output.lower() or "warning" in result.output.lower()
-        )
+        out = result.output.lower()
+        assert "no skills" in out or "warning" in out
 
     @patch("mcp_skills.models.config.MCPSkillsConfig")
     @patch("mcp_skills.cli.commands.doctor.IndexingEngine")
@@ -122,7 +121,8 @@ class TestDoctorCommand:
 
         # Verify warning about index
         assert result.exit_code == 0
-        assert "index" in result.output.lower() or "warning" in result.output.lower()
+        out = result.output.lower()
+        assert "index" in out or "warning" in out
 
     @patch("mcp_skills.models.config.MCPSkillsConfig")
     @patch("mcp_skills.cli.commands.doctor.RepositoryManager")
@@ -170,7 +170,8 @@ class TestDoctorCommand:
 
         # Verify warning about repositories
         assert result.exit_code == 0
-        assert "repository" in result.output.lower() or "repo" in result.output.lower()
+        out = result.output.lower()
+        assert "repository" in out or "repo" in out
 
     def test_doctor_displays_summary(
         self,
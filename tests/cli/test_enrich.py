@@ -2,333 +2,208 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
+from dataclasses import replace
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 
+import click
 import pytest
 from click.testing import CliRunner
 
 from mcp_skills.cli.main import cli
 
 
+ENRICH_TOKENS = ("enrich", "prompt")
+ENRICHED_TOKENS = ("enriched", "prompt")
+ERROR_TOKENS = ("failed", "error")
+
+
 class TestEnrichCommand:
     """Test suite for enrich command."""
 
-    def test_enrich_help(self, cli_runner: CliRunner) -> None:
+    def test_enrich_help(self, cli_help: Callable[[tuple[str, ...]], str]) -> None:
         """Test enrich command help."""
-        result = cli_runner.invoke(cli, ["enrich", "--help"])
+        help_text = cli_help(("enrich",))
 
-        assert result.exit_code == 0
-        assert "Enrich" in result.output or "prompt" in result.output.lower()
-        assert "--max-skills" in result.output or "--output" in result.output
+        out = help_text.lower()
+        assert any(tok in out for tok in ENRICH_TOKENS)
+        assert "--max-skills" in help_text or "--output" in help_text
 
-    @patch("mcp_skills.cli.main.PromptEnricher")
-    @patch("mcp_skills.cli.commands.enrich.SkillManager")
     def test_enrich_with_prompt_text(
         self,
-        mock_manager_cls: Mock,
-        mock_enricher_cls: Mock,
+        enrich_services: Mock,
         cli_runner: CliRunner,
     ) -> None:
         """Test enrich command with direct prompt text."""
-        # Setup mocks
-        mock_manager = Mock()
-        mock_manager_cls.return_value = mock_manager
-
-        mock_enricher = Mock()
-        mock_enricher.enrich_prompt.return_value = "Enriched prompt content"
-        mock_enricher_cls.return_value = mock_enricher
-
-        # Run command
         result = cli_runner.invoke(
             cli,
-            ["enrich", "--prompt", "Write a test for authentication"],
+            ["enrich", "Write a test for authentication"],
+            catch_exceptions=False,
         )
 
-        # Verify
         assert result.exit_code == 0
-        assert "Enriched" in result.output or "prompt" in result.output.lower()
+        out = result.output.lower()
+        assert any(tok in out for tok in ENRICHED_TOKENS)
 
-    @patch("mcp_skills.cli.main.PromptEnricher")
-    @patch("mcp_skills.cli.commands.enrich.SkillManager")
     def test_enrich_with_file(
         self,
-        mock_manager_cls: Mock,
-        mock_enricher_cls: Mock,
-        cli_runner: CliRunner,
-        tmp_path: Path,
+        enrich_services: Mock,
+        invoke_fast: Callable[[list[str]], int],
+        sample_prompt_file: Path,
     ) -> None:
-        """Test enrich command with file input."""
-        # Create test file
-        test_file = tmp_path / "prompt.txt"
-        test_file.write_text("Write a test for authentication")
-
-        # Setup mocks
-        mock_manager = Mock()
-        mock_manager_cls.return_value = mock_manager
+        """Test enrich command with prompt read from a file."""
+        exit_code = invoke_fast(["enrich", "--file", str(sample_prompt_file)])
 
-        mock_enricher = Mock()
-        mock_enricher.enrich_prompt.return_value = "Enriched prompt content"
-        mock_enricher_cls.return_value = mock_enricher
-
-        # Run command
-        result = cli_runner.invoke(
-            cli,
-            ["enrich", "--file", str(test_file)],
+        assert exit_code == 0
+        enrich_services.extract_keywords.assert_called_once_with(
+            "Write a test for authentication"
         )
 
-        # Verify
-        assert result.exit_code == 0
-
-    @patch("mcp_skills.cli.main.PromptEnricher")
-    @patch("mcp_skills.cli.commands.enrich.SkillManager")
     def test_enrich_with_output_file(
         self,
-        mock_manager_cls: Mock,
-        mock_enricher_cls: Mock,
-        cli_runner: CliRunner,
+        enrich_services: Mock,
+        invoke_fast: Callable[[list[str]], int],
         tmp_path: Path,
     ) -> None:
         """Test enrich command with output file."""
-        # Setup mocks
-        mock_manager = Mock()
-        mock_manager_cls.return_value = mock_manager
-
-        mock_enricher = Mock()
-        mock_enricher.enrich_prompt.return_value = "Enriched prompt content"
-        mock_enricher_cls.return_value = mock_enricher
-
-        # Run command
         output_file = tmp_path / "output.txt"
-        result = cli_runner.invoke(
-            cli,
+        exit_code = invoke_fast(
             [
                 "enrich",
-                "--prompt",
                 "Test prompt",
                 "--output",
                 str(output_file),
-            ],
+            ]
         )
 
-        # Verify
-        assert result.exit_code == 0
+        assert exit_code == 0
         # Output file should be created
         assert output_file.exists()
 
-    def test_enrich_requires_prompt_or_file(
-        self,
-        cli_runner: CliRunner,
-    ) -> None:
+    def test_enrich_requires_prompt_or_file(self) -> None:
         """Test enrich command requires either --prompt or --file."""
-        result = cli_runner.invoke(cli, ["enrich"])
-
         # Should fail without input
-        assert result.exit_code != 0
+        with pytest.raises(click.UsageError):
+            cli.main(["enrich"], standalone_mode=False)
 
-    @patch("mcp_skills.cli.main.PromptEnricher")
-    @patch("mcp_skills.cli.commands.enrich.SkillManager")
     def test_enrich_with_limit(
         self,
-        mock_manager_cls: Mock,
-        mock_enricher_cls: Mock,
-        cli_runner: CliRunner,
+        enrich_services: Mock,
+        invoke_fast: Callable[[list[str]], int],
     ) -> None:
         """Test enrich command with skill limit."""
-        # Setup mocks
-        mock_manager = Mock()
-        mock_manager_cls.return_value = mock_manager
+        exit_code = invoke_fast(["enrich", "Test prompt", "--max-skills", "3"])
 
-        mock_enricher = Mock()
-        mock_enricher.enrich_prompt.return_value = "Enriched prompt content"
-        mock_enricher_cls.return_value = mock_enricher
-
-        # Run command
-        result = cli_runner.invoke(
-            cli,
-            ["enrich", "--prompt", "Test prompt", "--limit", "3"],
+        assert exit_code == 0
+        enrich_services.search_skills.assert_called_once_with(
+            enrich_services.extract_keywords.return_value, 3
         )
 
-        # Verify
-        assert result.exit_code == 0
-
-    @patch("mcp_skills.cli.main.PromptEnricher")
-    @patch("mcp_skills.cli.commands.enrich.SkillManager")
     def test_enrich_with_mode(
         self,
-        mock_manager_cls: Mock,
-        mock_enricher_cls: Mock,
-        cli_runner: CliRunner,
+        enrich_services: Mock,
+        invoke_fast: Callable[[list[str]], int],
     ) -> None:
-        """Test enrich command with search mode."""
-        # Setup mocks
-        mock_manager = Mock()
-        mock_manager_cls.return_value = mock_manager
-
-        mock_enricher = Mock()
-        mock_enricher.enrich_prompt.return_value = "Enriched prompt content"
-        mock_enricher_cls.return_value = mock_enricher
-
-        # Run command
-        result = cli_runner.invoke(
-            cli,
-            ["enrich", "--prompt", "Test prompt", "--mode", "vector"],
-        )
+        """Test enrich command with detailed output mode."""
+        exit_code = invoke_fast(["enrich", "Test prompt", "--detailed"])
 
-        # Verify
-        assert result.exit_code == 0
+        assert exit_code == 0
+        assert enrich_services.enrich.call_args.kwargs["detailed"] is True
 
-    def test_enrich_file_not_found(
-        self,
-        cli_runner: CliRunner,
-    ) -> None:
+    def test_enrich_file_not_found(self) -> None:
         """Test enrich command with non-existent file."""
-        result = cli_runner.invoke(
-            cli,
-            ["enrich", "--file", "/nonexistent/file.txt"],
-        )
+        # Rejected by --file's exists=True check before the command runs
+        with pytest.raises(click.BadParameter, match="does not exist"):
+            cli.main(
+                ["enrich", "--file", "/nonexistent/file.txt"], standalone_mode=False
+            )
 
-        # Should fail with file not found
-        assert result.exit_code != 0
-
-    @patch("mcp_skills.cli.main.PromptEnricher")
-    @patch("mcp_skills.cli.commands.enrich.SkillManager")
     def test_enrich_error_handling(
         self,
-        mock_manager_cls: Mock,
-        mock_enricher_cls: Mock,
-        cli_runner: CliRunner,
+        enrich_services: Mock,
+        capsys: pytest.CaptureFixture[str],
     ) -> None:
         """Test enrich command error handling."""
-        # Setup mocks
-        mock_manager = Mock()
-        mock_manager_cls.return_value = mock_manager
+        enrich_services.enrich.side_effect = Exception("Enrichment failed")
 
-        mock_enricher = Mock()
-        mock_enricher.enrich_prompt.side_effect = Exception("Enrichment failed")
-        mock_enricher_cls.return_value = mock_enricher
-
-        # Run command
-        result = cli_runner.invoke(
-            cli,
-            ["enrich", "--prompt", "Test prompt"],
-        )
+        with pytest.raises(SystemExit) as exc_info:
+            cli.main(["enrich", "Test prompt"], standalone_mode=False)
 
         # Verify error handling
-        assert result.exit_code != 0
-        assert "failed" in result.output.lower() or "error" in result.output.lower()
+        assert exc_info.value.code != 0
+        out = capsys.readouterr().out.lower()
+        assert any(tok in out for tok in ERROR_TOKENS)
 
-    @patch("mcp_skills.cli.main.PromptEnricher")
-    @patch("mcp_skills.cli.commands.enrich.SkillManager")
     def test_enrich_displays_enriched_content(
         self,
-        mock_manager_cls: Mock,
-        mock_enricher_cls: Mock,
+        enrich_services: Mock,
         cli_runner: CliRunner,
     ) -> None:
         """Test enrich command displays enriched content."""
-        # Setup mocks
-        mock_manager = Mock()
-        mock_manager_cls.return_value = mock_manager
-
         enriched_text = "# Enriched Prompt\n\nTest content"
-        mock_enricher = Mock()
-        mock_enricher.enrich_prompt.return_value = enriched_text
-        mock_enricher_cls.return_value = mock_enricher
+        enrich_services.enrich.return_value = replace(
+            enrich_services.enrich.return_value, enriched_text=enriched_text
+        )
 
-        # Run command
         result = cli_runner.invoke(
             cli,
-            ["enrich", "--prompt", "Test prompt"],
+            ["enrich", "Test prompt"],
+            catch_exceptions=False,
         )
 
         # Verify enriched content is displayed
         assert result.exit_code == 0
+        assert "Test content" in result.output
 
-    @patch("mcp_skills.cli.main.PromptEnricher")
-    @patch("mcp_skills.cli.commands.enrich.SkillManager")
     def test_enrich_with_stdin(
         self,
-        mock_manager_cls: Mock,
-        mock_enricher_cls: Mock,
+        enrich_services: Mock,
         cli_runner: CliRunner,
     ) -> None:
         """Test enrich command with stdin input."""
-        # Setup mocks
-        mock_manager = Mock()
-        mock_manager_cls.return_value = mock_manager
-
-        mock_enricher = Mock()
-        mock_enricher.enrich_prompt.return_value = "Enriched prompt content"
-        mock_enricher_cls.return_value = mock_enricher
-
-        # Run command with stdin
         result = cli_runner.invoke(
             cli,
-            ["enrich", "--prompt", "-"],
+            ["enrich", "-"],
             input="Test prompt from stdin",
+            catch_exceptions=False,
         )
 
         # Verify (may not be supported, but should handle gracefully)
         assert result.exit_code in [0, 2]
 
-    @patch("mcp_skills.cli.main.PromptEnricher")
-    @patch("mcp_skills.cli.commands.enrich.SkillManager")
     def test_enrich_no_relevant_skills(
         self,
-        mock_manager_cls: Mock,
-        mock_enricher_cls: Mock,
-        cli_runner: CliRunner,
+        enrich_services: Mock,
+        invoke_fast: Callable[[list[str]], int],
     ) -> None:
         """Test enrich command when no relevant skills found."""
-        # Setup mocks
-        mock_manager = Mock()
-        mock_manager_cls.return_value = mock_manager
-
-        mock_enricher = Mock()
-        mock_enricher.enrich_prompt.return_value = "Original prompt (no skills found)"
-        mock_enricher_cls.return_value = mock_enricher
+        enrich_services.search_skills.return_value = []
 
-        # Run command
-        result = cli_runner.invoke(
-            cli,
-            ["enrich", "--prompt", "Very obscure prompt"],
-        )
+        exit_code = invoke_fast(["enrich", "Very obscure prompt"])
 
         # Verify still completes
-        assert result.exit_code == 0
+        assert exit_code == 0
+        enrich_services.enrich.assert_not_called()
 
-    @patch("mcp_skills.cli.main.PromptEnricher")
-    @patch("mcp_skills.cli.commands.enrich.SkillManager")
     def test_enrich_with_context(
         self,
-        mock_manager_cls: Mock,
-        mock_enricher_cls: Mock,
-        cli_runner: CliRunner,
+        enrich_services: Mock,
+        invoke_fast: Callable[[list[str]], int],
     ) -> None:
         """Test enrich command with additional context."""
-        # Setup mocks
-        mock_manager = Mock()
-        mock_manager_cls.return_value = mock_manager
-
-        mock_enricher = Mock()
-        mock_enricher.enrich_prompt.return_value = "Enriched prompt with context"
-        mock_enricher_cls.return_value = mock_enricher
-
-        # Run command
-        result = cli_runner.invoke(
-            cli,
-            ["enrich", "--prompt", "Test prompt", "--context", "Python project"],
+        exit_code = invoke_fast(
+            ["enrich", "Test prompt", "--context", "Python project"]
         )
 
         # Verify (context flag may or may not exist)
-        assert result.exit_code in [0, 2]
+        assert exit_code in [0, 2]
 
 
+@pytest.mark.skip(reason="Requires full system setup")
 class TestEnrichCommandIntegration:
     """Integration tests for enrich command."""
 
-    @pytest.mark.skip(reason="Requires full system setup")
     def test_enrich_full_workflow(
         self,
         cli_runner: CliRunner,
@@ -337,7 +212,6 @@ class TestEnrichCommandIntegration:
         # This would require actual skills and enricher
         pass
 
-    @pytest.mark.skip(reason="Requires embeddings")
     def test_enrich_with_vector_search(
         self,
         cli_runner: CliRunner,
@@ -2,267 +2,159 @@
 
 from __future__ import annotations
 
-from unittest.mock import Mock, patch
+import re
+from collections.abc import Callable
+from dataclasses import replace
+from unittest.mock import Mock
 
+import pytest
 from click.testing import CliRunner
 
 from mcp_skills.cli.main import cli
 
 
+_NUM_RE = re.compile(r"\b\d+\b")
+INDEXING_TOKENS = ("indexing", "indexed")
+ERROR_TOKENS = ("failed", "error")
+
+
 class TestIndexCommand:
     """Test suite for index command."""
 
-    def test_index_help(self, cli_runner: CliRunner) -> None:
+    def test_index_help(self, cli_help: Callable[[tuple[str, ...]], str]) -> None:
         """Test index command help."""
-        result = cli_runner.invoke(cli, ["index", "--help"])
+        help_text = cli_help(("index",))
 
-        assert result.exit_code == 0
-        assert "Rebuild skill indices" in result.output
-        assert "--incremental" in result.output
-        assert "--force" in result.output
+        assert "Rebuild skill indices" in help_text
+        assert "--incremental" in help_text
+        assert "--force" in help_text
 
-    @patch("mcp_skills.cli.main.IndexingEngine")
-    @patch("mcp_skills.cli.commands.index.SkillManager")
     def test_index_basic(
         self,
-        mock_manager_cls: Mock,
-        mock_engine_cls: Mock,
+        index_services: Mock,
         cli_runner: CliRunner,
     ) -> None:
         """Test basic index command."""
-        # Setup mocks
-        mock_manager = Mock()
-        mock_manager.discover_skills.return_value = []
-        mock_manager_cls.return_value = mock_manager
-
-        mock_engine = Mock()
-        mock_engine.index_skills.return_value = None
-        mock_engine.get_stats.return_value = {
-            "total_skills": 10,
-            "total_embeddings": 100,
-            "index_size_mb": 2.5,
-        }
-        mock_engine_cls.return_value = mock_engine
-
-        # Run command
-        result = cli_runner.invoke(cli, ["index"])
-
-        # Verify
+        result = cli_runner.invoke(cli, ["index"], catch_exceptions=False)
+
         assert result.exit_code == 0
-        assert "Indexing" in result.output or "indexed" in result.output.lower()
+        out = result.output.lower()
+        assert any(tok in out for tok in INDEXING_TOKENS)
 
-    @patch("mcp_skills.cli.main.IndexingEngine")
-    @patch("mcp_skills.cli.commands.index.SkillManager")
     def test_index_incremental(
         self,
-        mock_manager_cls: Mock,
-        mock_engine_cls: Mock,
+        index_services: Mock,
         cli_runner: CliRunner,
     ) -> None:
         """Test index command with --incremental flag."""
-        # Setup mocks
-        mock_manager = Mock()
-        mock_manager.discover_skills.return_value = []
-        mock_manager_cls.return_value = mock_manager
-
-        mock_engine = Mock()
-        mock_engine.index_skills.return_value = None
-        mock_engine.get_stats.return_value = {
-            "total_skills": 10,
-            "total_embeddings": 100,
-        }
-        mock_engine_cls.return_value = mock_engine
-
-        # Run command
-        result = cli_runner.invoke(cli, ["index", "--incremental"])
-
-        # Verify
+        result = cli_runner.invoke(
+            cli, ["index", "--incremental"], catch_exceptions=False
+        )
+
         assert result.exit_code == 0
         assert "incremental" in result.output.lower() or result.exit_code == 0
 
-    @patch("mcp_skills.cli.main.IndexingEngine")
-    @patch("mcp_skills.cli.commands.index.SkillManager")
     def test_index_force(
         self,
-        mock_manager_cls: Mock,
-        mock_engine_cls: Mock,
-        cli_runner: CliRunner,
+        index_services: Mock,
+        invoke_fast: Callable[[list[str]], int],
     ) -> None:
         """Test index command with --force flag."""
-        # Setup mocks
-        mock_manager = Mock()
-        mock_manager.discover_skills.return_value = []
-        mock_manager_cls.return_value = mock_manager
-
-        mock_engine = Mock()
-        mock_engine.index_skills.return_value = None
-        mock_engine.get_stats.return_value = {
-            "total_skills": 5,
-            "total_embeddings": 50,
-        }
-        mock_engine_cls.return_value = mock_engine
-
-        # Run command
-        result = cli_runner.invoke(cli, ["index", "--force"])
-
-        # Verify
-        assert result.exit_code == 0
+        exit_code = invoke_fast(["index", "--force"])
+
+        assert exit_code == 0
+        index_services.reindex_all.assert_called_once_with(force=True)
 
-    @patch("mcp_skills.cli.main.IndexingEngine")
-    @patch("mcp_skills.cli.commands.index.SkillManager")
     def test_index_with_skills(
         self,
-        mock_manager_cls: Mock,
-        mock_engine_cls: Mock,
-        cli_runner: CliRunner,
-        mock_skill,
+        index_services: Mock,
+        invoke_fast: Callable[[list[str]], int],
     ) -> None:
         """Test index command with actual skills to index."""
-        # Setup mocks
-        mock_manager = Mock()
-        mock_manager.discover_skills.return_value = [mock_skill] * 5
-        mock_manager_cls.return_value = mock_manager
-
-        mock_engine = Mock()
-        mock_engine.index_skills.return_value = None
-        mock_engine.get_stats.return_value = {
-            "total_skills": 5,
-            "total_embeddings": 50,
-        }
-        mock_engine_cls.return_value = mock_engine
-
-        # Run command
-        result = cli_runner.invoke(cli, ["index"])
+        index_services.reindex_all.return_value = replace(
+            index_services.reindex_all.return_value, total_skills=5
+        )
+
+        exit_code = invoke_fast(["index"])
 
         # Verify indexing was called
-        assert result.exit_code == 0
-        mock_engine.index_skills.assert_called_once()
+        assert exit_code == 0
+        index_services.reindex_all.assert_called_once()
 
-    @patch("mcp_skills.cli.main.IndexingEngine")
-    @patch("mcp_skills.cli.commands.index.SkillManager")
     def test_index_no_skills(
         self,
-        mock_manager_cls: Mock,
-        mock_engine_cls: Mock,
+        index_services: Mock,
         cli_runner: CliRunner,
     ) -> None:
         """Test index command when no skills found."""
-        # Setup mocks
-        mock_manager = Mock()
-        mock_manager.discover_skills.return_value = []
-        mock_manager_cls.return_value = mock_manager
-
-        mock_engine = Mock()
-        mock_engine_cls.return_value = mock_engine
+        index_services.reindex_all.return_value = replace(
+            index_services.reindex_all.return_value, total_skills=0
+        )
 
-        # Run command
-        result = cli_runner.invoke(cli, ["index"])
+        result = cli_runner.invoke(cli, ["index"], catch_exceptions=False)
 
         # Verify appropriate message
         assert result.exit_code == 0
-        assert "No skills" in result.output or "0" in result.output
+        assert "No skills" in result.output or "0" in _NUM_RE.findall(result.output)
 
-    @patch("mcp_skills.cli.main.IndexingEngine")
-    @patch("mcp_skills.cli.commands.index.SkillManager")
     def test_index_error_handling(
         self,
-        mock_manager_cls: Mock,
-        mock_engine_cls: Mock,
-        cli_runner: CliRunner,
+        index_services: Mock,
+        capsys: pytest.CaptureFixture[str],
     ) -> None:
         """Test index command error handling."""
-        # Setup mock to raise exception
-        mock_manager = Mock()
-        mock_manager.list_skills.side_effect = Exception("Indexing failed")
-        mock_manager_cls.return_value = mock_manager
+        index_services.reindex_all.side_effect = Exception("Indexing failed")
 
-        # Run command
-        result = cli_runner.invoke(cli, ["index"])
+        with pytest.raises(SystemExit) as exc_info:
+            cli.main(["index"], standalone_mode=False)
 
         # Verify error handling
-        assert result.exit_code != 0
-        assert "failed" in result.output.lower() or "error" in result.output.lower()
+        assert exc_info.value.code != 0
+        out = capsys.readouterr().out.lower()
+        assert any(tok in out for tok in ERROR_TOKENS)
 
-    @patch("mcp_skills.cli.main.IndexingEngine")
-    @patch("mcp_skills.cli.commands.index.SkillManager")
     def test_index_displays_stats(
         self,
-        mock_manager_cls: Mock,
-        mock_engine_cls: Mock,
+        index_services: Mock,
         cli_runner: CliRunner,
     ) -> None:
         """Test index command displays statistics."""
-        # Setup mocks with stats
-        mock_manager = Mock()
-        mock_manager.discover_skills.return_value = []
-        mock_manager_cls.return_value = mock_manager
-
-        mock_engine = Mock()
-        mock_engine.index_skills.return_value = None
-        mock_engine.get_stats.return_value = {
-            "total_skills": 15,
-            "total_embeddings": 150,
-            "index_size_mb": 3.2,
-        }
-        mock_engine_cls.return_value = mock_engine
-
-        # Run command
-        result = cli_runner.invoke(cli, ["index"])
+        index_services.reindex_all.return_value = replace(
+            index_services.reindex_all.return_value, total_skills=15
+        )
+
+        result = cli_runner.invoke(cli, ["index"], catch_exceptions=False)
 
         # Verify stats are displayed
         assert result.exit_code == 0
-        assert "15" in result.output or "skills" in result.output.lower()
+        assert "15" in _NUM_RE.findall(result.output)
 
-    @patch("mcp_skills.cli.main.IndexingEngine")
-    @patch("mcp_skills.cli.commands.index.SkillManager")
     def test_index_incremental_and_force_mutually_exclusive(
         self,
-        mock_manager_cls: Mock,
-        mock_engine_cls: Mock,
-        cli_runner: CliRunner,
+        index_services: Mock,
+        invoke_fast: Callable[[list[str]], int],
     ) -> None:
         """Test that incremental and force flags work together."""
-        # Setup mocks
-        mock_manager = Mock()
-        mock_manager.discover_skills.return_value = []
-        mock_manager_cls.return_value = mock_manager
-
-        mock_engine = Mock()
-        mock_engine.index_skills.return_value = None
-        mock_engine_cls.return_value = mock_engine
-
         # Run command with both flags (should prioritize one)
-        result = cli_runner.invoke(cli, ["index", "--incremental", "--force"])
+        exit_code = invoke_fast(["index", "--incremental", "--force"])
 
         # Command should still work
-        assert result.exit_code == 0
+        assert exit_code == 0
 
-    @patch("mcp_skills.cli.main.IndexingEngine")
-    @patch("mcp_skills.cli.commands.index.SkillManager")
     def test_index_progress_display(
         self,
-        mock_manager_cls: Mock,
-        mock_engine_cls: Mock,
+        index_services: Mock,
         cli_runner: CliRunner,
-        mock_skill,
     ) -> None:
         """Test index command shows progress information."""
-        # Setup mocks
-        mock_manager = Mock()
-        mock_manager.discover_skills.return_value = [mock_skill] * 20
-        mock_manager_cls.return_value = mock_manager
-
-        mock_engine = Mock()
-        mock_engine.index_skills.return_value = None
-        mock_engine.get_stats.return_value = {
-            "total_skills": 20,
-            "total_embeddings": 200,
-        }
-        mock_engine_cls.return_value = mock_engine
-
-        # Run command
-        result = cli_runner.invoke(cli, ["index"])
+        index_services.reindex_all.return_value = replace(
+            index_services.reindex_all.return_value, total_skills=20
+        )
+
+        result = cli_runner.invoke(cli, ["index"], catch_exceptions=False)
 
         # Verify progress or completion message
         assert result.exit_code == 0
-        assert "20" in result.output or "complete" in result.output.lower()
+        assert "20" in _NUM_RE.findall(result.output) or (
+            "complete" in result.output.lower()
+        )
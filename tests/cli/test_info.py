@@ -0,0 +1,76 @@
+"""Tests for info and show commands."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from types import SimpleNamespace
+
+import pytest
+from click.testing import CliRunner
+
+from mcp_skills.cli.main import cli
+
+
+class TestInfoCommand:
+    """Test suite for info/show commands."""
+
+    def test_info_command(
+        self,
+        skill_manager_services: SimpleNamespace,
+        cli_runner: CliRunner,
+    ) -> None:
+        """Test info command displays skill details."""
+        # Run command
+        result = cli_runner.invoke(cli, ["info", "test-skill"], catch_exceptions=False)
+
+        # Verify
+        assert result.exit_code == 0
+        out = result.output.lower()
+        assert any(tok in out for tok in ("test-skill", "test skill"))
+
+    def test_info_command_skill_not_found(
+        self,
+        skill_manager_services: SimpleNamespace,
+        invoke_fast: Callable[[list[str]], int],
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        """Test info command reports a missing skill without failing."""
+        skill_manager_services.load_skill = lambda skill_id: None
+
+        exit_code = invoke_fast(["info", "nonexistent"])
+
+        # A missing skill is reported, not treated as an error exit
+        assert exit_code == 0
+        assert "skill not found: nonexistent" in capsys.readouterr().out.lower()
+
+    def test_show_command_alias(
+        self,
+        skill_manager_services: SimpleNamespace,
+        invoke_fast: Callable[[list[str]], int],
+    ) -> None:
+        """Test show command (alias for info)."""
+        # Run command
+        exit_code = invoke_fast(["show", "test-skill"])
+
+        # Verify
+        assert exit_code == 0
+
+    def test_info_displays_metadata(
+        self,
+        skill_manager_services: SimpleNamespace,
+        cli_runner: CliRunner,
+    ) -> None:
+        """Test info command displays skill metadata."""
+        # Run command
+        result = cli_runner.invoke(cli, ["info", "test-skill"], catch_exceptions=False)
+
+        # Verify metadata is displayed
+        assert result.exit_code == 0
+        out = result.output.lower()
+        assert any(tok in out for tok in ("version", "1.0.0"))
+
+    def test_info_help(self, cli_help: Callable[[tuple[str, ...]], str]) -> None:
+        """Test info command help."""
+        help_text = cli_help(("info",))
+
+        assert "Show detailed information" in help_text
@@ -9,7 +9,8 @@ Test Coverage:
 from __future__ import annotations
 
 from pathlib import Path
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
+from unittest.mock import Mock
 
 import pytest
 from click.testing import CliRunner
@@ -45,24 +46,18 @@ class TestInstallDefaultBehavior:
             ),
         ]
 
-    @patch("mcp_skills.cli.main.AgentInstaller")
-    @patch("mcp_skills.cli.commands.install.AgentDetector")
     def test_default_install_excludes_claude_desktop(
         self,
-        mock_detector_cls: Mock,
-        mock_installer_cls: Mock,
+        install_services: SimpleNamespace,
         cli_runner: CliRunner,
         mock_detected_agents,
     ):
         """Test that default install excludes Claude Desktop (Bug Fix #1)."""
         # Setup detector mock
-        mock_detector = Mock()
-        mock_detector.detect_all.return_value = mock_detected_agents
-        mock_detector_cls.return_value = mock_detector
+        install_services.detector.detect_all.return_value = mock_detected_agents
 
         # Setup installer mock
-        mock_installer = Mock()
-        mock_installer.install.return_value = Mock(
+        install_services.installer.install.return_value = Mock(
             success=True,
             agent_name="Claude Code",
             agent_id="claude-code",
@@ -71,7 +66,6 @@ class TestInstallDefaultBehavior:
             error=None,
             changes_made="Added mcp-skillset",
         )
-        mock_installer_cls.return_value = mock_installer
 
         # Run install with default (no --agent flag)
         result = cli_runner.invoke(cli, ["install", "--force", "--dry-run"])
@@ -87,25 +81,19 @@ class TestInstallDefaultBehavior:
         output_lower = result.output.lower()
         assert "claude code" in output_lower or "code" in output_lower
 
-    @patch("mcp_skills.cli.main.AgentInstaller")
-    @patch("mcp_skills.cli.commands.install.AgentDetector")
     def test_explicit_claude_desktop_still_works(
         self,
-        mock_detector_cls: Mock,
-        mock_installer_cls: Mock,
+        install_services: SimpleNamespace,
         cli_runner: CliRunner,
         mock_detected_agents,
     ):
         """Test that --agent claude-desktop still works explicitly (Bug Fix #1)."""
         # Setup detector mock
-        mock_detector = Mock()
         claude_desktop = mock_detected_agents[0]  # Claude Desktop
-        mock_detector.detect_agent.return_value = claude_desktop
-        mock_detector_cls.return_value = mock_detector
+        install_services.detector.detect_agent.return_value = claude_desktop
 
         # Setup installer mock
-        mock_installer = Mock()
-        mock_installer.install.return_value = Mock(
+        install_services.installer.install.return_value = Mock(
             success=True,
             agent_name="Claude Desktop",
             agent_id="claude-desktop",
@@ -114,7 +102,6 @@ class TestInstallDefaultBehavior:
             error=None,
             changes_made="Added mcp-skillset",
         )
-        mock_installer_cls.return_value = mock_installer
 
         # Run install with explicit --agent claude-desktop
         result = cli_runner.invoke(
@@ -126,26 +113,19 @@ class TestInstallDefaultBehavior:
         assert "Claude Desktop" in result.output
 
         # Verify detect_agent was called with claude-desktop
-        mock_detector.detect_agent.assert_called_with("claude-desktop")
+        install_services.detector.detect_agent.assert_called_with("claude-desktop")
 
-    @patch("mcp_skills.cli.main.AgentInstaller")
-    @patch("mcp_skills.cli.commands.install.AgentDetector")
     def test_claude_code_selected_by_default(
         self,
-        mock_detector_cls: Mock,
-        mock_installer_cls: Mock,
+        install_services: SimpleNamespace,
         cli_runner: CliRunner,
         mock_detected_agents,
     ):
         """Test that Claude Code is selected when using default (Bug Fix #1)."""
         # Setup detector mock
-        mock_detector = Mock()
-        mock_detector.detect_all.return_value = mock_detected_agents
-        mock_detector_cls.return_value = mock_detector
+        install_services.detector.detect_all.return_value = mock_detected_agents
 
         # Setup installer mock
-        mock_installer = Mock()
-
         def install_side_effect(agent, **kwargs):
             return Mock(
                 success=True,
@@ -157,8 +137,7 @@ class TestInstallDefaultBehavior:
                 changes_made=f"Added mcp-skillset for {agent.name}",
             )
 
-        mock_installer.install.side_effect = install_side_effect
-        mock_installer_cls.return_value = mock_installer
+        install_services.installer.install.side_effect = install_side_effect
 
         # Run install with default
         result = cli_runner.invoke(cli, ["install", "--force", "--dry-run"])
@@ -167,7 +146,7 @@ class TestInstallDefaultBehavior:
         assert result.exit_code == 0
 
         # Get all install calls
-        install_calls = mock_installer.install.call_args_list
+        install_calls = install_services.installer.install.call_args_list
 
         # Extract agent IDs from calls
         installed_agent_ids = [call[0][0].id for call in install_calls]
@@ -182,17 +161,13 @@ class TestInstallDefaultBehavior:
 class TestAgentNameDisplay:
     """Test suite for agent name display (Bug Fix #2)."""
 
-    @patch("mcp_skills.cli.main.AgentInstaller")
-    @patch("mcp_skills.cli.commands.install.AgentDetector")
     def test_claude_code_displays_correct_name(
         self,
-        mock_detector_cls: Mock,
-        mock_installer_cls: Mock,
+        install_services: SimpleNamespace,
         cli_runner: CliRunner,
     ):
         """Test that Claude Code path displays as 'Claude Code' not 'Claude Desktop'."""
         # Setup detector mock
-        mock_detector = Mock()
         claude_code = DetectedAgent(
             name="Claude Code",
             id="claude-code",
@@ -201,12 +176,10 @@ class TestAgentNameDisplay:
             ),
             exists=True,
         )
-        mock_detector.detect_agent.return_value = claude_code
-        mock_detector_cls.return_value = mock_detector
+        install_services.detector.detect_agent.return_value = claude_code
 
         # Setup installer mock
-        mock_installer = Mock()
-        mock_installer.install.return_value = Mock(
+        install_services.installer.install.return_value = Mock(
             success=True,
             agent_name="Claude Code",
             agent_id="claude-code",
@@ -214,7 +187,6 @@ class TestAgentNameDisplay:
             backup_path=None,
             error=None,
         )
-        mock_installer_cls.return_value = mock_installer
 
         # Run install
         result = cli_runner.invoke(
@@ -234,12 +206,9 @@ class TestAgentNameDisplay:
                 assert "Claude Code" in line
                 assert "Claude Desktop" not in line
 
-    @patch("mcp_skills.cli.main.AgentInstaller")
-    @patch("mcp_skills.cli.commands.install.AgentDetector")
     def test_all_agents_display_correct_names(
         self,
-        mock_detector_cls: Mock,
-        mock_installer_cls: Mock,
+        install_services: SimpleNamespace,
         cli_runner: CliRunner,
     ):
         """Test that all agents display their correct names."""
@@ -271,13 +240,7 @@ class TestAgentNameDisplay:
         ]
 
         # Setup detector mock
-        mock_detector = Mock()
-        mock_detector.detect_all.return_value = agents
-        mock_detector_cls.return_value = mock_detector
-
-        # Setup installer mock (not really needed for this test)
-        mock_installer = Mock()
-        mock_installer_cls.return_value = mock_installer
+        install_services.detector.detect_all.return_value = agents
 
         # Run install (will be filtered to exclude claude-desktop by default)
         result = cli_runner.invoke(cli, ["install", "--dry-run"])
@@ -0,0 +1,95 @@
+"""Tests for list command."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from click.testing import CliRunner
+
+from mcp_skills.cli.main import cli
+
+
+class TestListCommand:
+    """Test suite for list command."""
+
+    def test_list_command(
+        self,
+        skill_manager_services: SimpleNamespace,
+        cli_runner: CliRunner,
+    ) -> None:
+        """Test list command displays skills."""
+        # Run command
+        result = cli_runner.invoke(cli, ["list"], catch_exceptions=False)
+
+        # Verify
+        assert result.exit_code == 0
+        assert "Available Skills" in result.output or "Skills" in result.output
+
+    def test_list_command_with_category(
+        self,
+        skill_manager_services: SimpleNamespace,
+        invoke_fast: Callable[[list[str]], int],
+    ) -> None:
+        """Test list command with category filter."""
+        # Run command
+        exit_code = invoke_fast(["list", "--category", "testing"])
+
+        # Verify
+        assert exit_code == 0
+
+    def test_list_command_compact_mode(
+        self,
+        skill_manager_services: SimpleNamespace,
+        cli_runner: CliRunner,
+        mock_skill,
+    ) -> None:
+        """Test list command in compact mode."""
+        # Report 20 skills while rendering only one row
+        skills = MagicMock(spec=list)
+        skills.__len__.return_value = 20
+        skills.__iter__.side_effect = lambda: iter([mock_skill])
+        skill_manager_services.discover_skills = lambda: skills
+
+        # Run command
+        result = cli_runner.invoke(cli, ["list", "--compact"], catch_exceptions=False)
+
+        # Verify
+        assert result.exit_code == 0
+        assert "Total: 20 skills" in result.output
+
+    def test_list_command_no_skills(
+        self,
+        skill_manager_services: SimpleNamespace,
+        cli_runner: CliRunner,
+    ) -> None:
+        """Test list command when no skills available."""
+        skill_manager_services.discover_skills = lambda: []
+
+        # Run command
+        result = cli_runner.invoke(cli, ["list"], catch_exceptions=False)
+
+        # Verify
+        assert result.exit_code == 0
+        assert "No skills" in result.output or "0" in result.output
+
+    def test_list_displays_categories(
+        self,
+        skill_manager_services: SimpleNamespace,
+        invoke_fast: Callable[[list[str]], int],
+    ) -> None:
+        """Test list command displays skill categories."""
+        # Run command
+        exit_code = invoke_fast(["list"])
+
+        # Verify
+        assert exit_code == 0
+
+    def test_list_help(self, cli_help: Callable[[tuple[str, ...]], str]) -> None:
+        """Test list command help."""
+        help_text = cli_help(("list",))
+
+        assert "List all available skills" in help_text
+        assert "--category" in help_text
+        assert "--compact" in help_text
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from unittest.mock import Mock, patch
+import re
+from collections.abc import Callable
+from types import SimpleNamespace
 
 import pytest
 from click.testing import CliRunner
@@ -10,169 +12,123 @@ from click.testing import CliRunner
 from mcp_skills.cli.main import cli
 
 
+_DEVISH = re.compile(r"dev(elopment)?", re.IGNORECASE)
+
+
 class TestMCPCommand:
     """Test suite for mcp command."""
 
-    def test_mcp_help(self, cli_runner: CliRunner) -> None:
+    def test_mcp_help(self, cli_help: Callable[[tuple[str, ...]], str]) -> None:
         """Test mcp command help."""
-        result = cli_runner.invoke(cli, ["mcp", "--help"])
+        help_text = cli_help(("mcp",))
+
+        assert "Start MCP server" in help_text
+        assert "--dev" in help_text
 
-        assert result.exit_code == 0
-        assert "Start the MCP server" in result.output
-        assert "--dev" in result.output
-
-    @pytest.mark.skip(
-        reason="MCP server has I/O file closure issues with Click test runner"
-    )
-    @patch("mcp_skills.cli.commands.mcp_server.MCPSkillsServer")
-    @patch("mcp_skills.models.config.MCPSkillsConfig")
     def test_mcp_basic(
         self,
-        mock_config_cls: Mock,
-        mock_server_cls: Mock,
+        mcp_services: SimpleNamespace,
         cli_runner: CliRunner,
-        mock_config,
     ) -> None:
         """Test basic mcp command."""
-        # Setup mocks
-        mock_config_cls.load.return_value = mock_config
-
-        mock_server = Mock()
-        mock_server.run.return_value = None
-        mock_server_cls.return_value = mock_server
-
-        # Run command (will timeout or need ctrl+c)
-        result = cli_runner.invoke(cli, ["mcp"])
+        # Run command (mocked server main returns immediately)
+        result = cli_runner.invoke(cli, ["mcp"], catch_exceptions=False)
 
         # Verify
+        assert result.exit_code == 0
         assert "Starting MCP server" in result.output
+        mcp_services.main.assert_called_once_with()
 
-    @pytest.mark.skip(
-        reason="MCP server has I/O file closure issues with Click test runner"
-    )
-    @patch("mcp_skills.cli.commands.mcp_server.MCPSkillsServer")
-    @patch("mcp_skills.models.config.MCPSkillsConfig")
     def test_mcp_dev_mode(
         self,
-        mock_config_cls: Mock,
-        mock_server_cls: Mock,
+        mcp_services: SimpleNamespace,
         cli_runner: CliRunner,
-        mock_config,
     ) -> None:
         """Test mcp command with --dev flag."""
-        # Setup mocks
-        mock_config_cls.load.return_value = mock_config
-
-        mock_server = Mock()
-        mock_server.run.return_value = None
-        mock_server_cls.return_value = mock_server
-
         # Run command
-        result = cli_runner.invoke(cli, ["mcp", "--dev"])
+        result = cli_runner.invoke(cli, ["mcp", "--dev"], catch_exceptions=False)
 
         # Verify
+        assert result.exit_code == 0
         assert "Starting MCP server" in result.output
-        assert "dev" in result.output.lower() or "development" in result.output.lower()
+        assert _DEVISH.search(result.output)
 
-    @patch("mcp_skills.cli.commands.mcp_server.MCPSkillsServer")
-    @patch("mcp_skills.models.config.MCPSkillsConfig")
     def test_mcp_server_initialization_error(
         self,
-        mock_config_cls: Mock,
-        mock_server_cls: Mock,
-        cli_runner: CliRunner,
-        mock_config,
+        mcp_services: SimpleNamespace,
+        invoke_fast: Callable[[list[str]], int],
     ) -> None:
         """Test mcp command handles server initialization errors."""
         # Setup mocks
-        mock_config_cls.load.return_value = mock_config
-        mock_server_cls.side_effect = Exception("Server initialization failed")
+        mcp_services.main.side_effect = Exception("Server initialization failed")
 
         # Run command
-        result = cli_runner.invoke(cli, ["mcp"])
+        exit_code = invoke_fast(["mcp"])
 
         # Verify error handling
-        assert result.exit_code != 0
+        assert exit_code != 0
 
-    @patch("mcp_skills.models.config.MCPSkillsConfig")
     def test_mcp_config_load_error(
         self,
-        mock_config_cls: Mock,
-        cli_runner: CliRunner,
+        mcp_services: SimpleNamespace,
+        invoke_fast: Callable[[list[str]], int],
     ) -> None:
         """Test mcp command handles config loading errors."""
         # Setup mock to raise exception
-        mock_config_cls.load.side_effect = Exception("Config load failed")
+        mcp_services.configure_services.side_effect = Exception("Config load failed")
 
         # Run command
-        result = cli_runner.invoke(cli, ["mcp"])
+        exit_code = invoke_fast(["mcp"])
 
         # Verify error handling
-        assert result.exit_code != 0
+        assert exit_code != 0
 
     def test_mcp_displays_startup_message(
         self,
+        mcp_services: SimpleNamespace,
         cli_runner: CliRunner,
     ) -> None:
         """Test mcp command displays startup message."""
-        # Run command (will fail without proper setup, but should show message)
+        # Run command (server entry points are mocked, so it returns at once)
         result = cli_runner.invoke(cli, ["mcp"])
 
         # Verify startup message appears (even if server fails to start)
         assert "MCP" in result.output or "server" in result.output.lower()
 
-    @pytest.mark.skip(reason="MCP server runs indefinitely")
-    @patch("mcp_skills.cli.commands.mcp_server.MCPSkillsServer")
-    @patch("mcp_skills.models.config.MCPSkillsConfig")
     def test_mcp_can_be_interrupted(
         self,
-        mock_config_cls: Mock,
-        mock_server_cls: Mock,
+        mcp_services: SimpleNamespace,
         cli_runner: CliRunner,
-        mock_config,
     ) -> None:
         """Test mcp command can be interrupted with Ctrl+C."""
         # Setup mocks
-        mock_config_cls.load.return_value = mock_config
-
-        mock_server = Mock()
-        mock_server.run.side_effect = KeyboardInterrupt()
-        mock_server_cls.return_value = mock_server
+        mcp_services.main.side_effect = KeyboardInterrupt()
 
         # Run command
         result = cli_runner.invoke(cli, ["mcp"])
 
         # Verify graceful shutdown
-        assert "Shutting down" in result.output or result.exit_code == 1
+        assert result.exit_code == 0
+        assert "Server stopped by user" in result.output
 
-    @patch("mcp_skills.cli.main.SkillManager")
-    @patch("mcp_skills.models.config.MCPSkillsConfig")
     def test_mcp_verifies_skills_available(
         self,
-        mock_config_cls: Mock,
-        mock_manager_cls: Mock,
-        cli_runner: CliRunner,
-        mock_config,
+        mcp_services: SimpleNamespace,
+        invoke_fast: Callable[[list[str]], int],
     ) -> None:
         """Test mcp command verifies skills are available."""
-        # Setup mocks
-        mock_config_cls.load.return_value = mock_config
-
-        mock_manager = Mock()
-        mock_manager.discover_skills.return_value = []
-        mock_manager_cls.return_value = mock_manager
-
-        # Run command (should warn about no skills)
-        result = cli_runner.invoke(cli, ["mcp"])
+        # Run command (should configure services before serving)
+        exit_code = invoke_fast(["mcp"])
 
         # Command may warn but shouldn't necessarily fail
-        assert result.exit_code in [0, 1]
+        assert exit_code in [0, 1]
+        mcp_services.configure_services.assert_called_once()
 
 
+@pytest.mark.skip(reason="Requires full MCP server setup and a client")
 class TestMCPCommandIntegration:
     """Integration tests for mcp command."""
 
-    @pytest.mark.skip(reason="Requires full MCP server setup")
     def test_mcp_full_startup_sequence(
         self,
         cli_runner: CliRunner,
@@ -181,7 +137,6 @@ class TestMCPCommandIntegration:
         # This would require actual server setup
         pass
 
-    @pytest.mark.skip(reason="Requires client connection")
     def test_mcp_handles_client_connections(
         self,
         cli_runner: CliRunner,
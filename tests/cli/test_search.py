@@ -2,335 +2,210 @@
 
 from __future__ import annotations
 
-from unittest.mock import Mock, patch
+from collections.abc import Callable
+from unittest.mock import Mock
 
+import click
+import pytest
 from click.testing import CliRunner
 
 from mcp_skills.cli.main import cli
+from mcp_skills.models.skill import Skill
+from mcp_skills.services.indexing.hybrid_search import ScoredSkill
 
 
-class TestSearchCommand:
-    """Test suite for search command."""
+DEFAULT_SEARCH = {"category": None, "top_k": 10}
 
-    def test_search_help(self, cli_runner: CliRunner) -> None:
-        """Test search command help."""
-        result = cli_runner.invoke(cli, ["search", "--help"])
-
-        assert result.exit_code == 0
-        assert "Search for skills" in result.output
-        assert "query" in result.output.lower()
+# (extra cli args, expected IndexingEngine.search kwargs, number of results)
+SEARCH_VARIANTS = [
+    pytest.param([], DEFAULT_SEARCH, 1, id="basic"),
+    pytest.param(["--limit", "3"], {"category": None, "top_k": 3}, 3, id="limit"),
+    pytest.param(
+        ["--category", "testing"],
+        {"category": "testing", "top_k": 10},
+        1,
+        id="category",
+    ),
+    pytest.param(["--search-mode", "balanced"], DEFAULT_SEARCH, 1, id="search-mode"),
+    pytest.param([], DEFAULT_SEARCH, 10, id="multiple-results"),
+]
 
-    @patch("mcp_skills.cli.commands.search.SkillManager")
-    def test_search_basic(
-        self,
-        mock_manager_cls: Mock,
-        cli_runner: CliRunner,
-        mock_skill,
-    ) -> None:
-        """Test basic search command."""
-        # Setup mock
-        mock_manager = Mock()
-        mock_manager.search_skills.return_value = [mock_skill]
-        mock_manager_cls.return_value = mock_manager
 
-        # Run command
-        result = cli_runner.invoke(cli, ["search", "testing"])
+@pytest.fixture(scope="module")
+def scored_results(mock_skill: Skill) -> tuple[ScoredSkill, ...]:
+    """Provide ten scored results, built once per module; slice for fewer."""
+    return (ScoredSkill(skill=mock_skill, score=0.95, match_type="hybrid"),) * 10
 
-        # Verify
-        assert result.exit_code == 0
-        assert "Searching for" in result.output or "testing" in result.output
 
-    @patch("mcp_skills.cli.commands.search.SkillManager")
-    def test_search_no_results(
-        self,
-        mock_manager_cls: Mock,
-        cli_runner: CliRunner,
-    ) -> None:
-        """Test search command with no results."""
-        # Setup mock
-        mock_manager = Mock()
-        mock_manager.search_skills.return_value = []
-        mock_manager_cls.return_value = mock_manager
-
-        # Run command
-        result = cli_runner.invoke(cli, ["search", "nonexistent"])
-
-        # Verify
-        assert result.exit_code == 0
-        assert "No skills found" in result.output or "0" in result.output
-
-    @patch("mcp_skills.cli.commands.search.SkillManager")
-    def test_search_with_limit(
-        self,
-        mock_manager_cls: Mock,
-        cli_runner: CliRunner,
-        mock_skill,
-    ) -> None:
-        """Test search command with limit parameter."""
-        # Setup mock
-        mock_manager = Mock()
-        mock_manager.search_skills.return_value = [mock_skill] * 5
-        mock_manager_cls.return_value = mock_manager
+class TestSearchCommand:
+    """Test suite for search command."""
 
-        # Run command
-        result = cli_runner.invoke(cli, ["search", "test", "--limit", "3"])
+    def test_search_help(self, cli_help: Callable[[tuple[str, ...]], str]) -> None:
+        """Test search command help."""
+        help_text = cli_help(("search",))
 
-        # Verify
-        assert result.exit_code == 0
+        assert "Search for skills" in help_text
+        assert "query" in help_text.lower()
 
-    @patch("mcp_skills.cli.commands.search.SkillManager")
-    def test_search_with_mode(
+    @pytest.mark.parametrize(("args", "search_kwargs", "n_results"), SEARCH_VARIANTS)
+    def test_search_variants(
         self,
-        mock_manager_cls: Mock,
+        search_services: Mock,
+        scored_results: tuple[ScoredSkill, ...],
         cli_runner: CliRunner,
-        mock_skill,
+        args: list[str],
+        search_kwargs: dict[str, object],
+        n_results: int,
     ) -> None:
-        """Test search command with mode parameter."""
+        """Test search command for each option combination and result count."""
         # Setup mock
-        mock_manager = Mock()
-        mock_manager.search_skills.return_value = [mock_skill]
-        mock_manager_cls.return_value = mock_manager
+        search_services.search.return_value = scored_results[:n_results]
 
         # Run command
         result = cli_runner.invoke(
-            cli,
-            ["search", "test", "--mode", "vector"],
+            cli, ["search", "testing", *args], catch_exceptions=False
         )
 
-        # Verify
+        # Verify query, options and relevance scores are displayed
         assert result.exit_code == 0
+        assert "Searching for" in result.output
+        search_services.search.assert_called_once_with("testing", **search_kwargs)
+        assert f"Search Results ({n_results} found)" in result.output
+        assert "0.95" in result.output
 
-    @patch("mcp_skills.cli.commands.search.SkillManager")
-    def test_search_with_threshold(
+    def test_search_no_results(
         self,
-        mock_manager_cls: Mock,
+        search_services: Mock,
         cli_runner: CliRunner,
-        mock_skill,
     ) -> None:
-        """Test search command with similarity threshold."""
+        """Test search command with no results."""
         # Setup mock
-        mock_manager = Mock()
-        mock_manager.search_skills.return_value = [mock_skill]
-        mock_manager_cls.return_value = mock_manager
+        search_services.search.return_value = []
 
         # Run command
         result = cli_runner.invoke(
-            cli,
-            ["search", "test", "--threshold", "0.7"],
+            cli, ["search", "nonexistent"], catch_exceptions=False
         )
 
         # Verify
         assert result.exit_code == 0
+        assert "No results found" in result.output
 
-    @patch("mcp_skills.cli.commands.search.SkillManager")
-    def test_search_multiple_results(
-        self,
-        mock_manager_cls: Mock,
-        cli_runner: CliRunner,
-        mock_skill,
-    ) -> None:
-        """Test search command with multiple results."""
-        # Setup mock
-        mock_manager = Mock()
-        mock_manager.search_skills.return_value = [mock_skill] * 10
-        mock_manager_cls.return_value = mock_manager
-
-        # Run command
-        result = cli_runner.invoke(cli, ["search", "test"])
-
-        # Verify multiple results displayed
-        assert result.exit_code == 0
-
-    @patch("mcp_skills.cli.commands.search.SkillManager")
-    def test_search_displays_relevance_scores(
-        self,
-        mock_manager_cls: Mock,
-        cli_runner: CliRunner,
-        mock_skill,
-    ) -> None:
-        """Test search command displays relevance scores."""
-        # Setup mock
-        mock_manager = Mock()
-        mock_manager.search_skills.return_value = [mock_skill]
-        mock_manager_cls.return_value = mock_manager
-
-        # Run command
-        result = cli_runner.invoke(cli, ["search", "test"])
-
-        # Verify
-        assert result.exit_code == 0
-
-    @patch("mcp_skills.cli.commands.search.SkillManager")
     def test_search_error_handling(
         self,
-        mock_manager_cls: Mock,
-        cli_runner: CliRunner,
+        search_services: Mock,
+        invoke_fast: Callable[[list[str]], int],
     ) -> None:
         """Test search command error handling."""
         # Setup mock to raise exception
-        mock_manager = Mock()
-        mock_manager.search_skills.side_effect = Exception("Search failed")
-        mock_manager_cls.return_value = mock_manager
+        search_services.search.side_effect = Exception("Search failed")
 
         # Run command
-        result = cli_runner.invoke(cli, ["search", "test"])
+        exit_code = invoke_fast(["search", "test"])
 
         # Verify error handling
-        assert result.exit_code != 0
+        assert exit_code != 0
 
-    @patch("mcp_skills.cli.commands.search.SkillManager")
     def test_search_empty_query(
         self,
-        mock_manager_cls: Mock,
-        cli_runner: CliRunner,
+        search_services: Mock,
+        invoke_fast: Callable[[list[str]], int],
     ) -> None:
         """Test search command with empty query."""
         # Run command with empty query
-        result = cli_runner.invoke(cli, ["search", ""])
+        exit_code = invoke_fast(["search", ""])
 
         # Should handle gracefully
-        assert result.exit_code in [0, 2]  # 2 = missing argument
+        assert exit_code in [0, 2]  # 2 = missing argument
 
-    def test_search_requires_query(self, cli_runner: CliRunner) -> None:
+    def test_search_requires_query(self) -> None:
         """Test search command requires query argument."""
-        result = cli_runner.invoke(cli, ["search"])
-
         # Should fail without query
-        assert result.exit_code != 0
+        with pytest.raises(click.UsageError):
+            cli.main(["search"], standalone_mode=False)
 
 
 class TestRecommendCommand:
     """Test suite for recommend command."""
 
-    def test_recommend_help(self, cli_runner: CliRunner) -> None:
+    def test_recommend_help(self, cli_help: Callable[[tuple[str, ...]], str]) -> None:
         """Test recommend command help."""
-        result = cli_runner.invoke(cli, ["recommend", "--help"])
+        help_text = cli_help(("recommend",))
 
-        assert result.exit_code == 0
-        assert "Recommend skills" in result.output
+        assert "skill recommendations" in help_text
 
-    @patch("mcp_skills.cli.main.ToolchainDetector")
-    @patch("mcp_skills.cli.commands.search.SkillManager")
     def test_recommend_basic(
         self,
-        mock_manager_cls: Mock,
-        mock_detector_cls: Mock,
+        search_services: Mock,
         cli_runner: CliRunner,
-        mock_toolchain_info,
-        mock_skill,
     ) -> None:
         """Test basic recommend command."""
-        # Setup mocks
-        mock_detector = Mock()
-        mock_detector.detect.return_value = mock_toolchain_info
-        mock_detector_cls.return_value = mock_detector
-
-        mock_manager = Mock()
-        mock_manager.search_skills.return_value = [mock_skill]
-        mock_manager_cls.return_value = mock_manager
-
         # Run command
-        result = cli_runner.invoke(cli, ["recommend"])
+        result = cli_runner.invoke(cli, ["recommend"], catch_exceptions=False)
 
         # Verify
         assert result.exit_code == 0
         assert "Recommend" in result.output or "skills" in result.output.lower()
 
-    @patch("mcp_skills.cli.main.ToolchainDetector")
-    @patch("mcp_skills.cli.commands.search.SkillManager")
     def test_recommend_with_search_mode(
         self,
-        mock_manager_cls: Mock,
-        mock_detector_cls: Mock,
+        search_services: Mock,
         cli_runner: CliRunner,
-        mock_toolchain_info,
-        mock_skill,
     ) -> None:
         """Test recommend command with search mode."""
-        # Setup mocks
-        mock_detector = Mock()
-        mock_detector.detect.return_value = mock_toolchain_info
-        mock_detector_cls.return_value = mock_detector
-
-        mock_manager = Mock()
-        mock_manager.search_skills.return_value = [mock_skill]
-        mock_manager_cls.return_value = mock_manager
-
         # Run command
         result = cli_runner.invoke(
-            cli,
-            ["recommend", "--search-mode", "balanced"],
+            cli, ["recommend", "--search-mode", "balanced"], catch_exceptions=False
         )
 
         # Verify
         assert result.exit_code == 0
 
-    @patch("mcp_skills.cli.main.ToolchainDetector")
     def test_recommend_toolchain_detection_failed(
         self,
-        mock_detector_cls: Mock,
-        cli_runner: CliRunner,
+        search_services: Mock,
+        mock_toolchain_detector: Mock,
+        invoke_fast: Callable[[list[str]], int],
     ) -> None:
         """Test recommend command when toolchain detection fails."""
         # Setup mock to raise exception
-        mock_detector = Mock()
-        mock_detector.detect.side_effect = Exception("Detection failed")
-        mock_detector_cls.return_value = mock_detector
+        mock_toolchain_detector.detect.side_effect = Exception("Detection failed")
 
         # Run command
-        result = cli_runner.invoke(cli, ["recommend"])
+        exit_code = invoke_fast(["recommend"])
 
         # Verify error handling
-        assert result.exit_code != 0
+        assert exit_code != 0
 
-    @patch("mcp_skills.cli.main.ToolchainDetector")
-    @patch("mcp_skills.cli.commands.search.SkillManager")
     def test_recommend_no_matching_skills(
         self,
-        mock_manager_cls: Mock,
-        mock_detector_cls: Mock,
+        search_services: Mock,
         cli_runner: CliRunner,
-        mock_toolchain_info,
     ) -> None:
         """Test recommend command when no matching skills found."""
         # Setup mocks
-        mock_detector = Mock()
-        mock_detector.detect.return_value = mock_toolchain_info
-        mock_detector_cls.return_value = mock_detector
-
-        mock_manager = Mock()
-        mock_manager.search_skills.return_value = []
-        mock_manager_cls.return_value = mock_manager
+        search_services.search.return_value = []
 
         # Run command
-        result = cli_runner.invoke(cli, ["recommend"])
+        result = cli_runner.invoke(cli, ["recommend"], catch_exceptions=False)
 
         # Verify
         assert result.exit_code == 0
-        assert "No" in result.output or "0" in result.output
+        assert "No recommendations" in result.output
 
-    @patch("mcp_skills.cli.main.ToolchainDetector")
-    @patch("mcp_skills.cli.commands.search.SkillManager")
     def test_recommend_displays_recommendations(
         self,
-        mock_manager_cls: Mock,
-        mock_detector_cls: Mock,
+        search_services: Mock,
+        scored_results: tuple[ScoredSkill, ...],
         cli_runner: CliRunner,
-        mock_toolchain_info,
-        mock_skill,
     ) -> None:
         """Test recommend command displays recommendations."""
         # Setup mocks
-        mock_detector = Mock()
-        mock_detector.detect.return_value = mock_toolchain_info
-        mock_detector_cls.return_value = mock_detector
-
-        mock_manager = Mock()
-        mock_manager.search_skills.return_value = [mock_skill] * 5
-        mock_manager_cls.return_value = mock_manager
+        search_services.search.return_value = scored_results[:5]
 
         # Run command
-        result = cli_runner.invoke(cli, ["recommend"])
+        result = cli_runner.invoke(cli, ["recommend"], catch_exceptions=False)
 
         # Verify recommendations are displayed
         assert result.exit_code == 0
+        assert "Recommended Skills (5 found)" in result.output
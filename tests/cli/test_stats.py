@@ -0,0 +1,41 @@
+"""Tests for stats command."""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Callable
+from unittest.mock import Mock
+
+from click.testing import CliRunner
+
+from mcp_skills.cli.main import cli
+
+
+_NUM_RE = re.compile(r"\b\d+\b")
+
+
+class TestStatsCommand:
+    """Test suite for stats command."""
+
+    def test_stats_command(
+        self,
+        index_services: Mock,
+        cli_runner: CliRunner,
+    ) -> None:
+        """Test stats command displays statistics."""
+        # Run command
+        result = cli_runner.invoke(cli, ["stats"], catch_exceptions=False)
+
+        # Verify
+        assert result.exit_code == 0
+        out = result.output.lower()
+        assert any(tok in out for tok in ("statistics", "stats"))
+        # Total skills/graph nodes and graph edges from the mocked IndexStats
+        assert {"10", "15"} <= set(_NUM_RE.findall(result.output))
+
+    def test_stats_help(self, cli_help: Callable[[tuple[str, ...]], str]) -> None:
+        """Test stats command help."""
+        help_text = cli_help(("stats",))
+
+        out = help_text.lower()
+        assert any(tok in out for tok in ("display statistics", "stats"))
@@ -6,6 +6,17 @@ from pathlib import Path
 import pytest
 
 
+@pytest.fixture(autouse=True)
+def isolated_embedding_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep every VectorStore's persistent embedding cache out of ~/.cache.
+
+    Args:
+        tmp_path: Pytest temporary path fixture
+        monkeypatch: Pytest monkeypatch fixture
+    """
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+
+
 @pytest.fixture
 def temp_project_dir(tmp_path: Path) -> Generator[Path, None, None]:
     """Create temporary project directory for testing.
@@ -2,6 +2,7 @@
 
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -229,8 +230,13 @@ class TestIndexingEngineReindexAll:
         skill_manager.discover_skills = mock_discover
 
         engine = IndexingEngine(storage_path=temp_storage, skill_manager=skill_manager)
-        stats = engine.reindex_all()
+        with patch.object(
+            engine.vector_store, "index_skills", wraps=engine.vector_store.index_skills
+        ) as index_skills:
+            stats = engine.reindex_all()
 
+        # Embeddings are stored in one batch, not one call per skill
+        index_skills.assert_called_once_with(sample_skills)
         assert stats.total_skills == len(sample_skills)
         assert stats.graph_nodes == len(sample_skills)
 
@@ -1,6 +1,8 @@
 """Tests for SQLite metadata store."""
 
 import json
+import sqlite3
+from collections.abc import Iterator
 from datetime import UTC, datetime
 from pathlib import Path
 
@@ -10,6 +12,14 @@ from mcp_skills.models.repository import Repository
 from mcp_skills.services.metadata_store import MetadataStore
 
 
+@pytest.fixture
+def store() -> Iterator[MetadataStore]:
+    """In-memory metadata store (no database file or WAL I/O)."""
+    store = MetadataStore(db_path=Path(":memory:"))
+    yield store
+    store.close()
+
+
 class TestMetadataStore:
     """Test suite for MetadataStore."""
 
@@ -19,10 +29,8 @@ class TestMetadataStore:
         assert store is not None
         assert (tmp_path / "test.db").exists()
 
-    def test_add_and_get_repository(self, tmp_path: Path) -> None:
+    def test_add_and_get_repository(self, store: MetadataStore, tmp_path: Path) -> None:
         """Test adding and retrieving repository."""
-        store = MetadataStore(db_path=tmp_path / "test.db")
-
         repo = Repository(
             id="test/repo",
             url="https://github.com/test/repo.git",
@@ -43,16 +51,45 @@ class TestMetadataStore:
         assert retrieved.skill_count == 5
         assert retrieved.license == "MIT"
 
-    def test_get_nonexistent_repository(self, tmp_path: Path) -> None:
-        """Test getting non-existent repository returns None."""
+    def test_close_reopens_on_next_use(self, tmp_path: Path) -> None:
+        """Test store reconnects after close() and keeps its data."""
         store = MetadataStore(db_path=tmp_path / "test.db")
+
+        repo = Repository(
+            id="test/repo",
+            url="https://github.com/test/repo.git",
+            local_path=tmp_path / "repos" / "test/repo",
+            priority=50,
+            last_updated=datetime(2024, 1, 1, 12, 0, 0, tzinfo=UTC),
+            skill_count=5,
+            license="MIT",
+        )
+        store.add_repository(repo)
+
+        store.close()
+        store.close()  # Idempotent
+
+        assert store.get_repository("test/repo") is not None
+        store.close()
+
+    def test_closed_in_memory_store_raises(self) -> None:
+        """Test an in-memory store refuses use after close() discarded it."""
+        store = MetadataStore(db_path=Path(":memory:"))
+        store.close()
+
+        with pytest.raises(RuntimeError, match="closed"):
+            store.get_repository("test/repo")
+        store.close()  # Still idempotent
+
+    def test_get_nonexistent_repository(self, store: MetadataStore) -> None:
+        """Test getting non-existent repository returns None."""
         result = store.get_repository("nonexistent")
         assert result is None
 
-    def test_list_repositories_sorted(self, tmp_path: Path) -> None:
+    def test_list_repositories_sorted(
+        self, store: MetadataStore, tmp_path: Path
+    ) -> None:
         """Test listing repositories sorted by priority."""
-        store = MetadataStore(db_path=tmp_path / "test.db")
-
         # Add repositories with different priorities
         for name, priority in [("repo1", 30), ("repo2", 90), ("repo3", 50)]:
             repo = Repository(
@@ -73,10 +110,116 @@ class TestMetadataStore:
         assert repos[1].priority == 50
         assert repos[2].priority == 30
 
-    def test_update_repository(self, tmp_path: Path) -> None:
-        """Test updating repository metadata."""
-        store = MetadataStore(db_path=tmp_path / "test.db")
+    def test_iter_repositories_batches(
+        self, store: MetadataStore, tmp_path: Path
+    ) -> None:
+        """Test lazy iteration pages through all rows in priority order."""
+        store.add_repositories(
+            Repository(
+                id=f"test/repo{i}",
+                url=f"https://github.com/test/repo{i}.git",
+                local_path=tmp_path / "repos" / f"test/repo{i}",
+                priority=i,
+                last_updated=datetime.now(UTC),
+                skill_count=0,
+                license="MIT",
+            )
+            for i in range(5)
+        )
+
+        priorities = []
+        for repo in store.iter_repositories(batch_size=2):
+            # Store stays usable between items
+            assert store.get_repository(repo.id) is not None
+            priorities.append(repo.priority)
 
+        assert priorities == [4, 3, 2, 1, 0]
+
+    def test_iter_repositories_rejects_writes_while_open(
+        self, store: MetadataStore, tmp_path: Path
+    ) -> None:
+        """Test writes are refused until the scan is exhausted or closed."""
+        repo = Repository(
+            id="test/repo",
+            url="https://github.com/test/repo.git",
+            local_path=tmp_path / "repos" / "test/repo",
+            priority=50,
+            last_updated=datetime.now(UTC),
+            skill_count=0,
+            license="MIT",
+        )
+        store.add_repository(repo)
+
+        scan = store.iter_repositories()
+        current = next(scan)
+        current.skill_count = 3
+        with pytest.raises(RuntimeError, match="iter_repositories"):
+            store.update_repository(current)
+        with pytest.raises(RuntimeError, match="iter_repositories"):
+            store.delete_repository(current.id)
+
+        scan.close()
+        store.update_repository(current)
+        retrieved = store.get_repository(repo.id)
+        assert retrieved is not None
+        assert retrieved.skill_count == 3
+
+    def test_list_repositories_uses_priority_index(self, tmp_path: Path) -> None:
+        """Test listing walks the priority index instead of sorting."""
+        db_path = tmp_path / "test.db"
+
+        # Simulate a database created with the old one-column priority index
+        conn = sqlite3.connect(db_path)
+        conn.execute(
+            "CREATE TABLE repositories (id TEXT PRIMARY KEY, url TEXT NOT NULL, "
+            "local_path TEXT NOT NULL, priority INTEGER DEFAULT 0, "
+            "last_updated TIMESTAMP, skill_count INTEGER DEFAULT 0, license TEXT)"
+        )
+        conn.execute("CREATE INDEX idx_repos_priority ON repositories(priority DESC)")
+        conn.commit()
+        conn.close()
+
+        MetadataStore(db_path=db_path)
+
+        conn = sqlite3.connect(db_path)
+        columns = conn.execute("PRAGMA index_info(idx_repos_priority)").fetchall()
+        plan = " ".join(
+            row[-1]
+            for row in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT id, url, local_path, priority, "
+                "last_updated, skill_count, license FROM repositories "
+                "ORDER BY priority DESC"
+            )
+        )
+        conn.close()
+
+        assert [col[2] for col in columns] == ["priority", "id"]
+        assert "idx_repos_priority" in plan
+        assert "TEMP B-TREE" not in plan
+
+    def test_get_repositories_batch(self, store: MetadataStore, tmp_path: Path) -> None:
+        """Test fetching several repositories in one call."""
+        for name in ("repo1", "repo2"):
+            store.add_repository(
+                Repository(
+                    id=f"test/{name}",
+                    url=f"https://github.com/test/{name}.git",
+                    local_path=tmp_path / "repos" / f"test/{name}",
+                    priority=50,
+                    last_updated=datetime.now(UTC),
+                    skill_count=1,
+                    license="MIT",
+                )
+            )
+
+        repos = store.get_repositories(["test/repo1", "test/repo2", "missing"])
+
+        assert set(repos) == {"test/repo1", "test/repo2"}
+        assert repos["test/repo2"].url == "https://github.com/test/repo2.git"
+        assert store.get_repositories([]) == {}
+
+    def test_update_repository(self, store: MetadataStore, tmp_path: Path) -> None:
+        """Test updating repository metadata."""
         repo = Repository(
             id="test/repo",
             url="https://github.com/test/repo.git",
@@ -100,10 +243,10 @@ class TestMetadataStore:
         assert updated.skill_count == 10
         assert updated.priority == 80
 
-    def test_update_nonexistent_repository(self, tmp_path: Path) -> None:
+    def test_update_nonexistent_repository(
+        self, store: MetadataStore, tmp_path: Path
+    ) -> None:
         """Test updating non-existent repository raises error."""
-        store = MetadataStore(db_path=tmp_path / "test.db")
-
         repo = Repository(
             id="nonexistent",
             url="https://github.com/test/repo.git",
@@ -117,10 +260,8 @@ class TestMetadataStore:
         with pytest.raises(ValueError, match="Repository not found"):
             store.update_repository(repo)
 
-    def test_delete_repository(self, tmp_path: Path) -> None:
+    def test_delete_repository(self, store: MetadataStore, tmp_path: Path) -> None:
         """Test deleting repository."""
-        store = MetadataStore(db_path=tmp_path / "test.db")
-
         repo = Repository(
             id="test/repo",
             url="https://github.com/test/repo.git",
@@ -137,17 +278,13 @@ class TestMetadataStore:
         store.delete_repository("test/repo")
         assert store.get_repository("test/repo") is None
 
-    def test_delete_nonexistent_repository(self, tmp_path: Path) -> None:
+    def test_delete_nonexistent_repository(self, store: MetadataStore) -> None:
         """Test deleting non-existent repository raises error."""
-        store = MetadataStore(db_path=tmp_path / "test.db")
-
         with pytest.raises(ValueError, match="Repository not found"):
             store.delete_repository("nonexistent")
 
-    def test_has_data(self, tmp_path: Path) -> None:
+    def test_has_data(self, store: MetadataStore, tmp_path: Path) -> None:
         """Test checking if database has data."""
-        store = MetadataStore(db_path=tmp_path / "test.db")
-
         assert not store.has_data()
 
         repo = Repository(
@@ -163,7 +300,7 @@ class TestMetadataStore:
         store.add_repository(repo)
         assert store.has_data()
 
-    def test_migrate_from_json(self, tmp_path: Path) -> None:
+    def test_migrate_from_json(self, store: MetadataStore, tmp_path: Path) -> None:
         """Test migrating repositories from JSON to SQLite."""
         # Create JSON file with repository data
         json_file = tmp_path / "repos.json"
@@ -194,7 +331,6 @@ class TestMetadataStore:
             json.dump(json_data, f)
 
         # Migrate to SQLite
-        store = MetadataStore(db_path=tmp_path / "test.db")
         count = store.migrate_from_json(json_file)
 
         assert count == 2
@@ -207,13 +343,125 @@ class TestMetadataStore:
         assert repos[1].id == "test/repo1"
         assert repos[1].priority == 50
 
-    def test_migrate_from_nonexistent_json(self, tmp_path: Path) -> None:
-        """Test migration from non-existent JSON file."""
+    def test_migrate_from_ndjson(self, store: MetadataStore, tmp_path: Path) -> None:
+        """Test migrating from line-delimited JSON (one repo per line)."""
+        json_file = tmp_path / "repos.jsonl"
+        json_file.write_text(
+            "\n".join(
+                json.dumps(
+                    {
+                        "id": f"test/{name}",
+                        "url": f"https://github.com/test/{name}.git",
+                        "local_path": str(tmp_path / "repos" / f"test/{name}"),
+                        "priority": priority,
+                        "last_updated": "2024-01-01T12:00:00",
+                        "skill_count": 1,
+                        "license": "MIT",
+                    }
+                )
+                for name, priority in [("repo1", 10), ("repo2", 20)]
+            )
+            + "\n"
+        )
+
+        assert store.migrate_from_json(json_file) == 2
+        assert [r.id for r in store.list_repositories()] == ["test/repo2", "test/repo1"]
+
+    @pytest.mark.parametrize(
+        ("prefix", "suffix"),
+        [
+            pytest.param("\n  \n", "\n", id="leading-blank-lines"),
+            pytest.param("", "", id="no-trailing-newline"),
+        ],
+    )
+    def test_migrate_from_ndjson_layout(
+        self, store: MetadataStore, tmp_path: Path, prefix: str, suffix: str
+    ) -> None:
+        """Test ND-JSON detection skips blank lines and reads the last line."""
+        json_file = tmp_path / "repos.jsonl"
+        lines = [
+            json.dumps(
+                {
+                    "id": f"test/repo{i}",
+                    "url": f"https://github.com/test/repo{i}.git",
+                    "local_path": str(tmp_path / "repos" / f"test/repo{i}"),
+                    "priority": i,
+                    "last_updated": "2024-01-01T12:00:00",
+                    "skill_count": 1,
+                    "license": "MIT",
+                }
+            )
+            for i in range(3)
+        ]
+        json_file.write_text(prefix + "\n".join(lines) + suffix)
+
+        assert store.migrate_from_json(json_file) == 3
+        assert store.get_repository("test/repo2") is not None
+
+    def test_migrate_from_ndjson_bad_line_rolls_back(
+        self, store: MetadataStore, tmp_path: Path
+    ) -> None:
+        """Test a malformed ND-JSON line aborts the whole streamed migration."""
+        json_file = tmp_path / "repos.jsonl"
+        good = json.dumps(
+            {
+                "id": "test/repo1",
+                "url": "https://github.com/test/repo1.git",
+                "local_path": str(tmp_path / "repos" / "test/repo1"),
+                "priority": 1,
+                "last_updated": "2024-01-01T12:00:00",
+                "skill_count": 1,
+                "license": "MIT",
+            }
+        )
+        json_file.write_text(f"{good}\n{{not json\n")
+
+        assert store.migrate_from_json(json_file) == 0
+        assert not store.has_data()
+
+    def test_migrate_large_json_rebuilds_index(self, tmp_path: Path) -> None:
+        """Test bulk migration keeps the priority index after rebuilding it."""
+        json_file = tmp_path / "repos.json"
+        json_data = {
+            "repositories": [
+                {
+                    "id": f"test/repo{i}",
+                    "url": f"https://github.com/test/repo{i}.git",
+                    "local_path": str(tmp_path / "repos" / f"test/repo{i}"),
+                    "priority": i % 100,
+                    "last_updated": "2024-01-01T12:00:00",
+                    "skill_count": 1,
+                    "license": "MIT",
+                }
+                for i in range(600)
+            ]
+        }
+        json_file.write_text(json.dumps(json_data))
+
         store = MetadataStore(db_path=tmp_path / "test.db")
+
+        assert store.migrate_from_json(json_file) == 600
+        assert store.list_repositories()[0].priority == 99
+
+        # WAL is checkpointed and truncated after the bulk load
+        wal = tmp_path / "test.db-wal"
+        assert not wal.exists() or wal.stat().st_size == 0
+
+        conn = sqlite3.connect(tmp_path / "test.db")
+        columns = conn.execute("PRAGMA index_info(idx_repos_priority)").fetchall()
+        conn.close()
+        assert [col[2] for col in columns] == ["priority", "id"]
+
+    def test_migrate_from_nonexistent_json(
+        self, store: MetadataStore, tmp_path: Path
+    ) -> None:
+        """Test migration from non-existent JSON file."""
         count = store.migrate_from_json(tmp_path / "nonexistent.json")
         assert count == 0
 
-    def test_migrate_skips_duplicates(self, tmp_path: Path) -> None:
+    def test_migrate_skips_duplicates(
+        self, store: MetadataStore, tmp_path: Path
+    ) -> None:
         """Test migration skips duplicate entries."""
         json_file = tmp_path / "repos.json"
         json_data = {
@@ -233,8 +481,6 @@ class TestMetadataStore:
         with open(json_file, "w") as f:
             json.dump(json_data, f)
 
-        store = MetadataStore(db_path=tmp_path / "test.db")
-
         # First migration
         count1 = store.migrate_from_json(json_file)
         assert count1 == 1
@@ -247,10 +493,10 @@ class TestMetadataStore:
         repos = store.list_repositories()
         assert len(repos) == 1
 
-    def test_duplicate_add_raises_error(self, tmp_path: Path) -> None:
+    def test_duplicate_add_raises_error(
+        self, store: MetadataStore, tmp_path: Path
+    ) -> None:
         """Test adding duplicate repository raises error."""
-        store = MetadataStore(db_path=tmp_path / "test.db")
-
         repo = Repository(
             id="test/repo",
             url="https://github.com/test/repo.git",
@@ -267,10 +513,31 @@ class TestMetadataStore:
         with pytest.raises(Exception):  # sqlite3.IntegrityError
             store.add_repository(repo)
 
-    def test_skill_methods_not_implemented(self, tmp_path: Path) -> None:
-        """Test skill methods raise NotImplementedError."""
-        store = MetadataStore(db_path=tmp_path / "test.db")
+    def test_add_repositories_batch(self, store: MetadataStore, tmp_path: Path) -> None:
+        """Test bulk insert is all-or-nothing."""
+        repos = [
+            Repository(
+                id=f"test/repo{i}",
+                url=f"https://github.com/test/repo{i}.git",
+                local_path=tmp_path / "repos" / f"test/repo{i}",
+                priority=i,
+                last_updated=datetime.now(UTC),
+                skill_count=i,
+                license="MIT",
+            )
+            for i in range(3)
+        ]
+
+        assert store.add_repositories(repos[:2]) == 2
 
+        # A duplicate anywhere in the batch rolls back the whole batch
+        with pytest.raises(sqlite3.IntegrityError):
+            store.add_repositories([repos[2], repos[0]])
+
+        assert [r.id for r in store.list_repositories()] == ["test/repo1", "test/repo0"]
+
+    def test_skill_methods_not_implemented(self, store: MetadataStore) -> None:
+        """Test skill methods raise NotImplementedError."""
         with pytest.raises(NotImplementedError):
             store.add_skill("skill-id", {})
 
@@ -1317,3 +1317,43 @@ class TestPrivateMethods:
 
         assert isinstance(frameworks, list)
         assert "Gin" in frameworks
+
+
+# =============================================================================
+# Detection Cache Tests
+# =============================================================================
+
+
+class TestDetectCache:
+    """Test memoization of detect() results."""
+
+    def test_detect_returns_independent_copies(
+        self, detector: ToolchainDetector, temp_python_project: Path
+    ) -> None:
+        """Test repeat detection is equal but not shared."""
+        first = detector.detect(temp_python_project)
+        first.frameworks.append("Mutated")
+
+        second = detector.detect(temp_python_project)
+
+        assert "Mutated" not in second.frameworks
+        assert second.primary_language == "Python"
+
+    def test_detect_refreshes_when_content_changes(
+        self, detector: ToolchainDetector, tmp_path: Path
+    ) -> None:
+        """Test editing a parsed file in place invalidates the cached result."""
+        (tmp_path / "requirements.txt").write_text("requests\n")
+        assert "Flask" not in detector.detect(tmp_path).frameworks
+
+        (tmp_path / "requirements.txt").write_text("requests\nflask==3.0.0\n")
+        assert "Flask" in detector.detect(tmp_path).frameworks
+
+    def test_clear_cache(
+        self, detector: ToolchainDetector, temp_python_project: Path
+    ) -> None:
+        """Test clear_cache empties the memoized results."""
+        detector.detect(temp_python_project)
+        detector.clear_cache()
+
+        assert detector._detect_cache == {}
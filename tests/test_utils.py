@@ -108,6 +108,19 @@ class TestSetupLogger:
             # Should have fewer handlers (no file handler)
             assert len(logger2.handlers) < initial_count
 
+    def test_setup_logger_repeat_call_keeps_handlers(self):
+        """Test identical repeat calls reuse the configured handlers."""
+        logger = setup_logger(name="test_repeat", level="DEBUG")
+        handlers = list(logger.handlers)
+
+        # Same config: handlers are left untouched
+        assert setup_logger(name="test_repeat", level="debug").handlers == handlers
+
+        # Different config: handlers are rebuilt
+        logger = setup_logger(name="test_repeat", level="INFO")
+        assert logger.level == logging.INFO
+        assert logger.handlers != handlers
+
     def test_setup_logger_file_handler_level(self):
         """Test that file handler respects log level."""
         with tempfile.TemporaryDirectory() as tmpdir:
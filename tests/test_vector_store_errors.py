@@ -1,13 +1,71 @@
 """Tests for VectorStore error handling and edge cases."""
 
+import hashlib
+import sqlite3
 import tempfile
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import replace
 from pathlib import Path
 from unittest.mock import patch
 
+import numpy as np
 import pytest
 
 from mcp_skills.models.skill import Skill
-from mcp_skills.services.indexing.vector_store import VectorStore
+from mcp_skills.services.indexing.vector_store import (
+    VectorStore,
+    _get_embedding_model,
+)
+
+
+VECTOR_STORE = "mcp_skills.services.indexing.vector_store"
+
+
+class StubEmbeddingModel:
+    """Stand-in for SentenceTransformer without the model forward pass.
+
+    Each text maps to a fixed pseudo-random unit vector, so embeddings stay
+    deterministic and distinct (no tied distances) across calls.
+    """
+
+    def encode(self, sentences, **kwargs):
+        texts = [sentences] if isinstance(sentences, str) else sentences
+        rows = np.empty((len(texts), 384), dtype=np.float32)
+        for row, text in enumerate(texts):
+            seed = hashlib.blake2b(text.encode(), digest_size=8).digest()
+            vec = np.random.default_rng(int.from_bytes(seed, "little")).normal(size=384)
+            rows[row] = vec / np.linalg.norm(vec)
+        return rows[0] if isinstance(sentences, str) else rows
+
+
+@contextmanager
+def stubbed_embeddings() -> Iterator[None]:
+    """Serve VectorStore embeddings from StubEmbeddingModel.
+
+    Replaces both model loaders: ours and the one behind ChromaDB's
+    SentenceTransformerEmbeddingFunction.
+    """
+    with (
+        patch(
+            f"{VECTOR_STORE}._get_embedding_model", return_value=StubEmbeddingModel()
+        ),
+        patch(
+            f"{VECTOR_STORE}.embedding_functions.SentenceTransformerEmbeddingFunction",
+            return_value=None,
+        ),
+    ):
+        yield
+
+
+@pytest.fixture(autouse=True)
+def stub_embeddings(request):
+    """Stub the embedding model unless a test is marked real_embeddings."""
+    if request.node.get_closest_marker("real_embeddings"):
+        yield
+        return
+    with stubbed_embeddings():
+        yield
 
 
 @pytest.fixture
@@ -17,6 +75,26 @@ def temp_storage():
         yield Path(tmpdir)
 
 
+@pytest.fixture(scope="session")
+def shared_vector_store(tmp_path_factory):
+    """Create one stubbed VectorStore (Chroma bootstrap) per session."""
+    # Session fixtures are set up before autouse ones, so stub explicitly
+    with stubbed_embeddings():
+        store = VectorStore(
+            persist_directory=tmp_path_factory.mktemp("chroma"),
+            cache_dir=tmp_path_factory.mktemp("embeddings"),
+        )
+    yield store
+    store.close()
+
+
+@pytest.fixture
+def vector_store(shared_vector_store):
+    """Yield the shared VectorStore, emptied again after each test."""
+    yield shared_vector_store
+    shared_vector_store.clear()
+
+
 @pytest.fixture
 def sample_skill():
     """Create a sample skill for testing."""
@@ -49,8 +127,12 @@ class TestVectorStoreInitializationErrors:
             with pytest.raises(RuntimeError, match="ChromaDB initialization failed"):
                 VectorStore()
 
+    @pytest.mark.real_embeddings
     def test_embedding_model_initialization_failure_raises_runtime_error(self):
         """Test that embedding model init failure raises RuntimeError."""
+        # Drop any model loaded by earlier tests so the patched loader runs
+        _get_embedding_model.cache_clear()
+
         with patch(
             "mcp_skills.services.indexing.vector_store.SentenceTransformer"
         ) as mock_model:
@@ -61,6 +143,16 @@ class TestVectorStoreInitializationErrors:
             ):
                 VectorStore()
 
+    def test_invalid_cache_precision_raises_value_error(self, temp_storage):
+        """Test that an unknown cache precision is rejected up front."""
+        with pytest.raises(ValueError, match="cache_precision"):
+            VectorStore(persist_directory=temp_storage, cache_precision="int4")
+
+    def test_invalid_embedding_backend_raises_value_error(self, temp_storage):
+        """Test that an unknown embedding backend is rejected up front."""
+        with pytest.raises(ValueError, match="embedding_backend"):
+            VectorStore(persist_directory=temp_storage, embedding_backend="tensorrt")
+
     def test_vector_store_creates_persist_directory(self, temp_storage):
         """Test that persist directory is created if it doesn't exist."""
         nested_dir = temp_storage / "nested" / "chroma"
@@ -77,7 +169,7 @@ class TestVectorStoreInitializationErrors:
 class TestVectorStoreIndexSkillErrors:
     """Test index_skill error handling."""
 
-    def test_index_skill_with_empty_embeddable_text_skips_indexing(self, temp_storage):
+    def test_index_skill_with_empty_embeddable_text_skips_indexing(self, vector_store):
         """Test that skill with empty embeddable text is skipped."""
         skill = Skill(
             id="test/empty",
@@ -92,7 +184,6 @@ class TestVectorStoreIndexSkillErrors:
             repo_id="test-repo",
         )
 
-        vector_store = VectorStore(persist_directory=temp_storage)
         initial_count = vector_store.count()
 
         # Should log warning and skip
@@ -102,11 +193,9 @@ class TestVectorStoreIndexSkillErrors:
         assert vector_store.count() == initial_count
 
     def test_index_skill_handles_chromadb_add_failure_gracefully(
-        self, temp_storage, sample_skill
+        self, vector_store, sample_skill
     ):
         """Test that ChromaDB add failure is handled gracefully."""
-        vector_store = VectorStore(persist_directory=temp_storage)
-
         # Mock collection.add to raise exception
         with patch.object(
             vector_store.collection, "add", side_effect=Exception("DB write failed")
@@ -121,7 +210,7 @@ class TestVectorStoreIndexSkillErrors:
 class TestVectorStoreBuildEmbeddingsErrors:
     """Test build_embeddings error handling."""
 
-    def test_build_embeddings_with_empty_text_returns_empty_list(self, temp_storage):
+    def test_build_embeddings_with_empty_text_returns_empty_list(self, vector_store):
         """Test that empty embeddable text returns empty embedding list."""
         skill = Skill(
             id="test/empty",
@@ -136,7 +225,6 @@ class TestVectorStoreBuildEmbeddingsErrors:
             repo_id="test-repo",
         )
 
-        vector_store = VectorStore(persist_directory=temp_storage)
         embeddings = vector_store.build_embeddings(skill)
 
         assert embeddings == []
@@ -145,6 +233,7 @@ class TestVectorStoreBuildEmbeddingsErrors:
         self, temp_storage, sample_skill
     ):
         """Test that encoding errors are handled gracefully."""
+        # Own store: the shared one may already have this embedding cached
         vector_store = VectorStore(persist_directory=temp_storage)
 
         # Mock embedding model to raise exception
@@ -162,43 +251,42 @@ class TestVectorStoreBuildEmbeddingsErrors:
 class TestVectorStoreSearchErrors:
     """Test search error handling."""
 
-    def test_search_with_empty_query_returns_empty_results(self, temp_storage):
+    def test_search_with_empty_query_returns_empty_results(self, vector_store):
         """Test that empty query returns empty results."""
-        vector_store = VectorStore(persist_directory=temp_storage)
         results = vector_store.search("", top_k=5)
 
         assert results == []
 
     def test_search_with_chromadb_query_failure_returns_empty_list(
-        self, temp_storage, sample_skill
+        self, vector_store, sample_skill
     ):
         """Test that ChromaDB query failure returns empty list."""
-        vector_store = VectorStore(persist_directory=temp_storage)
         vector_store.index_skill(sample_skill)
 
-        # Mock collection.query to raise exception
-        with patch.object(
-            vector_store.collection, "query", side_effect=Exception("Query failed")
+        # Mock collection.query to raise exception (and bypass the
+        # in-memory search so the query reaches ChromaDB)
+        with (
+            patch.object(vector_store, "MEM_SEARCH_THRESHOLD", 0),
+            patch.object(
+                vector_store.collection, "query", side_effect=Exception("Query failed")
+            ),
         ):
             results = vector_store.search("test query", top_k=5)
 
             # Should return empty list instead of raising
             assert results == []
 
-    def test_search_with_no_results_returns_empty_list(self, temp_storage):
+    def test_search_with_no_results_returns_empty_list(self, vector_store):
         """Test search with no indexed skills returns empty list."""
-        vector_store = VectorStore(persist_directory=temp_storage)
         results = vector_store.search("nonexistent query", top_k=5)
 
         assert results == []
 
-    def test_search_respects_top_k_limit(self, temp_storage):
+    def test_search_respects_top_k_limit(self, vector_store):
         """Test that search respects top_k parameter."""
-        vector_store = VectorStore(persist_directory=temp_storage)
-
-        # Index multiple skills
-        for i in range(10):
-            skill = Skill(
+        # Index multiple skills in one batch
+        skills = [
+            Skill(
                 id=f"test-repo/skill-{i}",
                 name=f"skill-{i}",
                 description=f"Test skill {i} description",
@@ -210,7 +298,9 @@ class TestVectorStoreSearchErrors:
                 file_path=Path(f"/tmp/test/SKILL-{i}.md"),
                 repo_id="test-repo",
             )
-            vector_store.index_skill(skill)
+            for i in range(10)
+        ]
+        assert vector_store.index_skills(skills) == 10
 
         # Search with top_k=3
         results = vector_store.search("test", top_k=3)
@@ -223,10 +313,9 @@ class TestVectorStoreClearErrors:
     """Test clear error handling."""
 
     def test_clear_with_chromadb_delete_failure_raises_exception(
-        self, temp_storage, sample_skill
+        self, vector_store, sample_skill
     ):
         """Test that ChromaDB delete failure raises exception."""
-        vector_store = VectorStore(persist_directory=temp_storage)
         vector_store.index_skill(sample_skill)
 
         # Mock collection.delete to raise exception
@@ -240,10 +329,8 @@ class TestVectorStoreClearErrors:
         ):
             vector_store.clear()
 
-    def test_clear_empty_store_handles_gracefully(self, temp_storage):
+    def test_clear_empty_store_handles_gracefully(self, vector_store):
         """Test that clearing empty store handles gracefully."""
-        vector_store = VectorStore(persist_directory=temp_storage)
-
         # Should not raise exception
         vector_store.clear()
 
@@ -254,12 +341,14 @@ class TestVectorStoreCountErrors:
     """Test count error handling."""
 
     def test_count_with_chromadb_count_failure_returns_zero(
-        self, temp_storage, sample_skill
+        self, vector_store, sample_skill
     ):
         """Test that ChromaDB count failure returns 0."""
-        vector_store = VectorStore(persist_directory=temp_storage)
         vector_store.index_skill(sample_skill)
 
+        # Drop the cached size so count() has to ask ChromaDB
+        vector_store._count = None
+
         # Mock collection.count to raise exception
         with patch.object(
             vector_store.collection, "count", side_effect=Exception("Count failed")
@@ -273,7 +362,7 @@ class TestVectorStoreCountErrors:
 class TestVectorStoreEdgeCases:
     """Test edge cases and boundary conditions."""
 
-    def test_index_skill_with_very_long_instructions(self, temp_storage):
+    def test_index_skill_with_very_long_instructions(self, vector_store):
         """Test that very long instructions are truncated properly."""
         long_instructions = "x" * 10000  # Much longer than 500 char limit
 
@@ -290,12 +379,12 @@ class TestVectorStoreEdgeCases:
             repo_id="test-repo",
         )
 
-        vector_store = VectorStore(persist_directory=temp_storage)
         vector_store.index_skill(skill)
 
         # Should index successfully (instructions truncated)
         assert vector_store.count() == 1
 
+    @pytest.mark.real_embeddings
     def test_index_skill_with_unicode_characters(self, temp_storage):
         """Test that unicode characters in skills are handled."""
         skill = Skill(
@@ -321,9 +410,10 @@ class TestVectorStoreEdgeCases:
         results = vector_store.search("unicode", top_k=5)
         assert len(results) > 0
 
-    def test_search_with_filters_applies_correctly(self, temp_storage):
+    def test_search_with_filters_applies_correctly(self, vector_store):
         """Test that metadata filters are applied correctly."""
-        # Index skills with different categories
+        # Index skills with different categories in one batch
+        skills = []
         for category in ["testing", "deployment", "debugging"]:
             skill = Skill(
                 id=f"test-repo/{category}-skill",
@@ -337,8 +427,8 @@ class TestVectorStoreEdgeCases:
                 file_path=Path(f"/tmp/test/{category}/SKILL.md"),
                 repo_id="test-repo",
             )
-            vector_store = VectorStore(persist_directory=temp_storage)
-            vector_store.index_skill(skill)
+            skills.append(skill)
+        vector_store.index_skills(skills)
 
         # Search with category filter
         results = vector_store.search(
@@ -349,6 +439,7 @@ class TestVectorStoreEdgeCases:
         for result in results:
             assert result["metadata"]["category"] == "testing"
 
+    @pytest.mark.real_embeddings
     def test_build_embeddings_creates_consistent_dimensions(
         self, temp_storage, sample_skill
     ):
@@ -364,3 +455,247 @@ class TestVectorStoreEdgeCases:
 
         # Should be deterministic (same input = same output)
         assert embedding1 == embedding2
+
+    def test_build_embeddings_reuses_cached_embedding(self, temp_storage, sample_skill):
+        """Test that repeated texts are served from the embedding cache."""
+        vector_store = VectorStore(persist_directory=temp_storage)
+
+        embedding1 = vector_store.build_embeddings(sample_skill)
+
+        # A cache hit must not reach the model
+        with patch.object(
+            vector_store.embedding_model,
+            "encode",
+            side_effect=AssertionError("encode called on cache hit"),
+        ):
+            embedding2 = vector_store.build_embeddings(sample_skill)
+
+        assert embedding1 == embedding2
+        stats = vector_store.get_stats()
+        assert stats["embedding_cache_hits"] == 1
+        assert stats["embedding_cache_misses"] == 1
+
+    def test_search_reuses_cached_results_until_index_changes(
+        self, vector_store, sample_skill, monkeypatch
+    ):
+        """Test that repeated searches are answered from the query cache."""
+        # Send cache misses to ChromaDB rather than the in-memory search
+        monkeypatch.setattr(vector_store, "MEM_SEARCH_THRESHOLD", 0)
+        vector_store.index_skill(sample_skill)
+
+        results = vector_store.search("test query", top_k=5)
+        assert results
+
+        # Repeat query must not reach ChromaDB
+        with patch.object(
+            vector_store.collection, "query", side_effect=Exception("Query failed")
+        ):
+            assert vector_store.search("test query", top_k=5) == results
+
+            # Indexing invalidates cached answers
+            vector_store.index_skill(replace(sample_skill, id="test-repo/other-skill"))
+            assert vector_store.search("test query", top_k=5) == []
+
+    def test_index_skills_splits_adds_by_max_batch_size(self, vector_store):
+        """Test that batches larger than ChromaDB's limit are split."""
+        skills = [
+            Skill(
+                id=f"test-repo/batch-{i}",
+                name=f"batch-{i}",
+                description=f"Batch skill {i}",
+                instructions=f"Instructions {i}",
+                category="testing",
+                tags=["test"],
+                dependencies=[],
+                examples=[],
+                file_path=Path(f"/tmp/test/batch-{i}/SKILL.md"),
+                repo_id="test-repo",
+            )
+            for i in range(5)
+        ]
+
+        with patch.object(
+            vector_store.chroma_client, "get_max_batch_size", return_value=2
+        ):
+            added = vector_store.index_skills(skills)
+
+        assert added == 5
+        assert vector_store.count() == 5
+
+    def test_index_skills_counts_only_new_ids(self, vector_store, sample_skill):
+        """Test that stored and repeated IDs are skipped and not counted."""
+        vector_store.index_skill(sample_skill)
+        other = replace(sample_skill, id="test-repo/other-skill")
+
+        assert vector_store.index_skills([sample_skill, other, other]) == 1
+        assert vector_store.count() == 2
+
+    def test_build_embeddings_reads_persistent_cache(
+        self, temp_storage, tmp_path, sample_skill
+    ):
+        """Test that a new store reuses embeddings persisted by an earlier one."""
+        cache_dir = tmp_path / "embeddings"
+        first = VectorStore(persist_directory=temp_storage, cache_dir=cache_dir)
+        embedding1 = first.build_embeddings(sample_skill)
+        first.close()
+
+        second = VectorStore(persist_directory=temp_storage, cache_dir=cache_dir)
+        with patch.object(
+            second.embedding_model,
+            "encode",
+            side_effect=AssertionError("encode called on cache hit"),
+        ):
+            embedding2 = second.build_embeddings(sample_skill)
+
+        # Persisted at full precision, so bit-identical to a fresh encode
+        assert embedding2 == embedding1
+        assert second.get_stats()["embedding_disk_hits"] == 1
+
+    def test_persistent_cache_is_separate_per_backend(
+        self, tmp_path, temp_storage, sample_skill
+    ):
+        """Test that one backend's cached vectors are not served to another."""
+        cache_dir = tmp_path / "embeddings"
+        torch_store = VectorStore(persist_directory=temp_storage, cache_dir=cache_dir)
+        torch_store.build_embeddings(sample_skill)
+        torch_store.close()
+
+        onnx_store = VectorStore(
+            persist_directory=temp_storage,
+            cache_dir=cache_dir,
+            embedding_backend="onnx",
+        )
+        onnx_store.build_embeddings(sample_skill)
+        assert onnx_store.get_stats()["embedding_disk_hits"] == 0
+        assert onnx_store.get_stats()["embedding_cache_misses"] == 1
+
+    def test_search_queries_are_not_persisted(self, tmp_path, temp_storage):
+        """Test that query embeddings stay in memory only."""
+        cache_dir = tmp_path / "embeddings"
+        vector_store = VectorStore(persist_directory=temp_storage, cache_dir=cache_dir)
+        vector_store.search("a private query")
+        vector_store.close()
+
+        with sqlite3.connect(cache_dir / "embeddings.db") as conn:
+            assert conn.execute("SELECT COUNT(*) FROM embeddings").fetchone() == (0,)
+        conn.close()
+
+    def test_persistent_cache_is_pruned_on_open(
+        self, tmp_path, temp_storage, sample_skill, monkeypatch
+    ):
+        """Test that only the most recently written vectors survive reopening."""
+        cache_dir = tmp_path / "embeddings"
+        first = VectorStore(persist_directory=temp_storage, cache_dir=cache_dir)
+        first.build_embeddings(sample_skill)
+        newest = replace(sample_skill, id="test-repo/newest", name="newest")
+        first.build_embeddings(newest)
+        first.close()
+
+        monkeypatch.setattr(VectorStore, "DISK_CACHE_SIZE", 1)
+        second = VectorStore(persist_directory=temp_storage, cache_dir=cache_dir)
+        second.build_embeddings(newest)
+        second.build_embeddings(sample_skill)
+
+        stats = second.get_stats()
+        assert stats["embedding_disk_hits"] == 1
+        assert stats["embedding_cache_misses"] == 1
+
+    def test_persistent_cache_drops_outdated_format(
+        self, temp_storage, tmp_path, sample_skill
+    ):
+        """Test that a cache file from an older vector format is discarded."""
+        cache_dir = tmp_path / "embeddings"
+        first = VectorStore(persist_directory=temp_storage, cache_dir=cache_dir)
+        first.build_embeddings(sample_skill)
+        first.close()
+
+        with sqlite3.connect(cache_dir / "embeddings.db") as conn:
+            conn.execute("PRAGMA user_version = 0")
+        conn.close()
+
+        second = VectorStore(persist_directory=temp_storage, cache_dir=cache_dir)
+        second.build_embeddings(sample_skill)
+        assert second.get_stats()["embedding_disk_hits"] == 0
+        assert second.get_stats()["embedding_cache_misses"] == 1
+
+    def test_new_collection_uses_configured_hnsw_parameters(self, temp_storage):
+        """Test that HNSW parameters are applied to a new collection."""
+        vector_store = VectorStore(persist_directory=temp_storage, hnsw_m=12)
+
+        metadata = vector_store.collection.metadata
+        assert metadata["hnsw:M"] == 12
+        assert metadata["hnsw:construction_ef"] == 100
+        assert metadata["hnsw:search_ef"] == 100
+
+    def test_memory_search_matches_chromadb_results(self, vector_store):
+        """Test that the in-memory search ranks and scores like ChromaDB."""
+        vector_store.index_skills(
+            [
+                Skill(
+                    id=f"test-repo/{category}-{i}",
+                    name=f"{category}-skill-{i}",
+                    description=f"Skill {i} for {category}",
+                    instructions=f"Instructions for {category} number {i}",
+                    category=category,
+                    tags=[category],
+                    dependencies=[],
+                    examples=[],
+                    file_path=Path(f"/tmp/test/{category}-{i}/SKILL.md"),
+                    repo_id="test-repo",
+                )
+                for category in ["testing", "deployment"]
+                for i in range(4)
+            ]
+        )
+
+        for filters in [None, {"category": "testing"}]:
+            in_memory = vector_store.search("deploy tests", top_k=5, filters=filters)
+            vector_store.clear_query_cache()
+            with patch.object(vector_store, "MEM_SEARCH_THRESHOLD", 0):
+                from_chromadb = vector_store.search(
+                    "deploy tests", top_k=5, filters=filters
+                )
+            vector_store.clear_query_cache()
+
+            assert [r["skill_id"] for r in in_memory] == [
+                r["skill_id"] for r in from_chromadb
+            ]
+            assert [r["score"] for r in in_memory] == pytest.approx(
+                [r["score"] for r in from_chromadb], abs=1e-4
+            )
+
+    def test_search_sees_writes_from_another_store(self, temp_storage, sample_skill):
+        """Test that the in-memory mirror and query cache follow other writers."""
+        server_store = VectorStore(persist_directory=temp_storage)
+        server_store.index_skill(sample_skill)
+        assert [r["skill_id"] for r in server_store.search("test", top_k=5)] == [
+            sample_skill.id
+        ]
+
+        other = replace(sample_skill, id="test-repo/other-skill", name="other")
+        VectorStore(persist_directory=temp_storage).index_skill(other)
+
+        results = server_store.search("test", top_k=5)
+        assert {r["skill_id"] for r in results} == {sample_skill.id, other.id}
+
+    def test_count_is_cached_between_changes(self, vector_store, sample_skill):
+        """Test that count() tracks adds and clears without querying ChromaDB."""
+        with patch.object(
+            vector_store.collection, "count", side_effect=AssertionError("queried")
+        ):
+            vector_store.index_skill(sample_skill)
+            vector_store.index_skill(sample_skill)  # Duplicate ID is ignored
+            assert vector_store.count() == 1
+
+            vector_store.clear()
+            assert vector_store.count() == 0
+
+    def test_count_sees_writes_from_another_store(self, temp_storage, sample_skill):
+        """Test that count() rereads ChromaDB after another writer changed it."""
+        server_store = VectorStore(persist_directory=temp_storage)
+        assert server_store.count() == 0
+
+        # e.g. a CLI reindex while the MCP server keeps its store open
+        VectorStore(persist_directory=temp_storage).index_skill(sample_skill)
+
+        assert server_store.count() == 1